@@ -4,8 +4,11 @@
 
 import pygame
 import math
+import numpy as np
 from abc import ABC, abstractmethod
-from ..utils.drawing import create_gradient_surface
+from ..utils.drawing import (
+    create_gradient_surface, create_linear_gradient_surface, create_vignette_surface
+)
 from ..config import (
     SCREEN_WIDTH, SCREEN_HEIGHT,
     BG_DARK, BG_MEDIUM, BG_SURFACE, WHITE, GRAY,
@@ -31,6 +34,7 @@ class Scene(ABC):
         self._fade_alpha = 0
         self._fade_in = False
         self._fade_out = False
+        self._fade_surface = None  # 淡入淡出遮罩（不透明黑色，以 set_alpha 調整）
 
         # 背景粒子
         self._bg_particles = []
@@ -82,39 +86,33 @@ class Scene(ABC):
             add_vignette: 是否加入暗角效果
             add_grid: 是否加入網格圖案
         """
-        surf = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-
-        # 基礎漸層
-        for y in range(SCREEN_HEIGHT):
-            ratio = y / SCREEN_HEIGHT
-            r = int(BG_DARK[0] + (base_color[0] - BG_DARK[0]) * ratio * 0.3)
-            g = int(BG_DARK[1] + (base_color[1] - BG_DARK[1]) * ratio * 0.3)
-            b = int(BG_DARK[2] + (base_color[2] - BG_DARK[2]) * ratio * 0.4)
-            pygame.draw.line(surf, (r, g, b), (0, y), (SCREEN_WIDTH, y))
+        # 基礎漸層（NumPy 向量化）
+        end_color = (
+            BG_DARK[0] + (base_color[0] - BG_DARK[0]) * 0.3,
+            BG_DARK[1] + (base_color[1] - BG_DARK[1]) * 0.3,
+            BG_DARK[2] + (base_color[2] - BG_DARK[2]) * 0.4,
+        )
+        surf = create_linear_gradient_surface(BG_DARK, end_color)
 
         # 網格圖案
         if add_grid:
             grid_surf = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
             grid_color = (255, 255, 255, 8)
             grid_spacing = 50
-            for x in range(0, SCREEN_WIDTH, grid_spacing):
-                pygame.draw.line(grid_surf, grid_color, (x, 0), (x, SCREEN_HEIGHT))
-            for y in range(0, SCREEN_HEIGHT, grid_spacing):
-                pygame.draw.line(grid_surf, grid_color, (0, y), (SCREEN_WIDTH, y))
+            # 整批繪製前先鎖定一次，避免每次 draw.line 各自鎖定/解鎖
+            grid_surf.lock()
+            try:
+                for x in range(0, SCREEN_WIDTH, grid_spacing):
+                    pygame.draw.line(grid_surf, grid_color, (x, 0), (x, SCREEN_HEIGHT))
+                for y in range(0, SCREEN_HEIGHT, grid_spacing):
+                    pygame.draw.line(grid_surf, grid_color, (0, y), (SCREEN_WIDTH, y))
+            finally:
+                grid_surf.unlock()
             surf.blit(grid_surf, (0, 0))
 
-        # 暗角效果
+        # 暗角效果（NumPy 向量化）
         if add_vignette:
-            vignette = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-            center_x, center_y = SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2
-            max_dist = math.sqrt(center_x**2 + center_y**2)
-
-            for y in range(0, SCREEN_HEIGHT, 4):
-                for x in range(0, SCREEN_WIDTH, 4):
-                    dist = math.sqrt((x - center_x)**2 + (y - center_y)**2)
-                    alpha = int(80 * (dist / max_dist) ** 1.5)
-                    pygame.draw.rect(vignette, (0, 0, 0, alpha), (x, y, 4, 4))
-            surf.blit(vignette, (0, 0))
+            surf.blit(create_vignette_surface(), (0, 0))
 
         return surf
 
@@ -161,6 +159,8 @@ class Scene(ABC):
 
     def update_fade(self, dt: float):
         """更新淡入淡出效果"""
+        if not (self._fade_in or self._fade_out):
+            return
         if self._fade_in:
             self._fade_alpha = max(0, self._fade_alpha - dt * 600)
             if self._fade_alpha <= 0:
@@ -171,9 +171,10 @@ class Scene(ABC):
     def draw_fade_overlay(self, screen: pygame.Surface):
         """繪製淡入淡出遮罩"""
         if self._fade_alpha > 0:
-            fade_surf = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-            fade_surf.fill((0, 0, 0, int(self._fade_alpha)))
-            screen.blit(fade_surf, (0, 0))
+            if self._fade_surface is None:
+                self._fade_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+            self._fade_surface.set_alpha(int(self._fade_alpha))
+            screen.blit(self._fade_surface, (0, 0))
 
 
 class Button:
@@ -309,6 +310,8 @@ class Button:
 class ProgressBar:
     """增強版進度條類別"""
 
+    SNAP_EPSILON = 1e-4  # 與目標差距小於此值即視為收斂
+
     def __init__(self, x: int, y: int, width: int, height: int,
                  bg_color=(40, 50, 70), fill_color=(52, 152, 219),
                  border_color=(80, 90, 110), fill_color_end=None):
@@ -324,6 +327,12 @@ class ProgressBar:
         self.shine_offset = -0.3
         self.glow_phase = 0.0
 
+        # 預繪製圖層快取（背景與圓角遮罩固定；填充依寬度重建）
+        self._bg_surf = None
+        self._round_mask = None
+        self._fill_surf = None
+        self._fill_width = 0
+
     def set_progress(self, value: float):
         """設定進度 (0.0 ~ 1.0)"""
         self._target_progress = max(0.0, min(1.0, value))
@@ -337,8 +346,13 @@ class ProgressBar:
 
     def update(self, dt: float):
         """更新動畫"""
-        # 平滑進度變化
-        self.progress += (self._target_progress - self.progress) * min(1.0, dt * 8)
+        # 平滑進度變化（已收斂時直接對齊目標，之後不再重算）
+        diff = self._target_progress - self.progress
+        if diff:
+            if abs(diff) < self.SNAP_EPSILON:
+                self.progress = self._target_progress
+            else:
+                self.progress += diff * min(1.0, dt * 8)
 
         # 光澤動畫
         self.shine_offset += dt * 0.6
@@ -350,54 +364,19 @@ class ProgressBar:
 
     def draw(self, screen: pygame.Surface):
         """繪製進度條"""
-        # 背景漸層
-        bg_surf = pygame.Surface((self.rect.width, self.rect.height), pygame.SRCALPHA)
-        for y in range(self.rect.height):
-            ratio = y / self.rect.height
-            brightness = 0.8 + ratio * 0.4
-            row_color = tuple(min(255, int(c * brightness)) for c in self.bg_color)
-            pygame.draw.line(bg_surf, (*row_color, 255), (0, y), (self.rect.width, y))
+        if self._bg_surf is None:
+            self._build_static_surfaces()
 
-        # 應用圓角
-        mask = pygame.Surface((self.rect.width, self.rect.height), pygame.SRCALPHA)
-        pygame.draw.rect(mask, (255, 255, 255, 255), (0, 0, self.rect.width, self.rect.height),
-                        border_radius=8)
-        bg_surf.blit(mask, (0, 0), special_flags=pygame.BLEND_RGBA_MIN)
-        screen.blit(bg_surf, self.rect.topleft)
+        # 背景漸層（預繪製）
+        screen.blit(self._bg_surf, self.rect.topleft)
 
-        # 填充漸層
+        # 填充漸層（寬度改變時才重建）
         if self.progress > 0:
             fill_width = max(1, int(self.rect.width * self.progress))
-            fill_surf = pygame.Surface((fill_width, self.rect.height), pygame.SRCALPHA)
-
-            for x in range(fill_width):
-                x_ratio = x / max(1, fill_width)
-                # 水平漸層
-                r = int(self.fill_color[0] + (self.fill_color_end[0] - self.fill_color[0]) * x_ratio)
-                g = int(self.fill_color[1] + (self.fill_color_end[1] - self.fill_color[1]) * x_ratio)
-                b = int(self.fill_color[2] + (self.fill_color_end[2] - self.fill_color[2]) * x_ratio)
-
-                for y in range(self.rect.height):
-                    y_ratio = y / self.rect.height
-                    # 垂直光澤
-                    brightness = 1.2 - y_ratio * 0.4
-                    pixel_color = (
-                        min(255, int(r * brightness)),
-                        min(255, int(g * brightness)),
-                        min(255, int(b * brightness)),
-                        255
-                    )
-                    fill_surf.set_at((x, y), pixel_color)
-
-            # 應用圓角遮罩
-            fill_mask = pygame.Surface((self.rect.width, self.rect.height), pygame.SRCALPHA)
-            pygame.draw.rect(fill_mask, (255, 255, 255, 255),
-                           (0, 0, self.rect.width, self.rect.height), border_radius=8)
-            clip_mask = pygame.Surface((fill_width, self.rect.height), pygame.SRCALPHA)
-            clip_mask.blit(fill_mask, (0, 0))
-            fill_surf.blit(clip_mask, (0, 0), special_flags=pygame.BLEND_RGBA_MIN)
-
-            screen.blit(fill_surf, self.rect.topleft)
+            if fill_width != self._fill_width:
+                self._fill_surf = self._build_fill_surface(fill_width)
+                self._fill_width = fill_width
+            screen.blit(self._fill_surf, self.rect.topleft)
 
             # 光澤效果
             if fill_width > 10:
@@ -423,6 +402,44 @@ class ProgressBar:
                            (0, 0, glow_rect.width, glow_rect.height), border_radius=10)
             screen.blit(glow_surf, glow_rect.topleft)
 
+    def _build_static_surfaces(self):
+        """預繪製圓角遮罩與背景漸層"""
+        width, height = self.rect.width, self.rect.height
+
+        self._round_mask = pygame.Surface((width, height), pygame.SRCALPHA)
+        pygame.draw.rect(self._round_mask, (255, 255, 255, 255), (0, 0, width, height),
+                         border_radius=8)
+
+        self._bg_surf = pygame.Surface((width, height), pygame.SRCALPHA)
+        for y in range(height):
+            ratio = y / height
+            brightness = 0.8 + ratio * 0.4
+            row_color = tuple(min(255, int(c * brightness)) for c in self.bg_color)
+            pygame.draw.line(self._bg_surf, (*row_color, 255), (0, y), (width, y))
+        self._bg_surf.blit(self._round_mask, (0, 0), special_flags=pygame.BLEND_RGBA_MIN)
+
+    def _build_fill_surface(self, fill_width: int) -> pygame.Surface:
+        """以 NumPy 產生指定寬度的填充漸層（水平漸層 × 垂直光澤，套用圓角遮罩）"""
+        height = self.rect.height
+
+        # 水平漸層
+        start = np.array(self.fill_color, dtype=np.float64)
+        delta = np.array(self.fill_color_end, dtype=np.float64) - start
+        x_ratio = np.arange(fill_width) / fill_width
+        rgb = (start + delta * x_ratio[:, None]).astype(np.int64)
+
+        # 垂直光澤
+        brightness = 1.2 - np.arange(height) / height * 0.4
+        pixels = np.minimum(255, (rgb[:, None, :] * brightness[None, :, None]).astype(np.int64))
+
+        fill_surf = pygame.Surface((fill_width, height), pygame.SRCALPHA)
+        fill_surf.fill((0, 0, 0, 255))
+        pygame.surfarray.pixels3d(fill_surf)[...] = pixels
+
+        # 應用圓角遮罩（超出填充寬度的部分自動裁切）
+        fill_surf.blit(self._round_mask, (0, 0), special_flags=pygame.BLEND_RGBA_MIN)
+        return fill_surf
+
     def _draw_shine(self, screen: pygame.Surface, fill_width: int):
         """繪製光澤效果"""
         if self.shine_offset < 0 or self.shine_offset > 1.2:
@@ -439,12 +456,7 @@ class ProgressBar:
                 pygame.draw.line(shine_surf, (255, 255, 255, alpha), (x, 0), (x, self.rect.height))
 
         # 應用遮罩
-        mask = pygame.Surface((self.rect.width, self.rect.height), pygame.SRCALPHA)
-        pygame.draw.rect(mask, (255, 255, 255, 255), (0, 0, self.rect.width, self.rect.height),
-                        border_radius=8)
-        clip = pygame.Surface((fill_width, self.rect.height), pygame.SRCALPHA)
-        clip.blit(mask, (0, 0))
-        shine_surf.blit(clip, (0, 0), special_flags=pygame.BLEND_RGBA_MIN)
+        shine_surf.blit(self._round_mask, (0, 0), special_flags=pygame.BLEND_RGBA_MIN)
 
         screen.blit(shine_surf, self.rect.topleft)
 
@@ -482,6 +494,12 @@ class ShapeCard:
         self.hover_progress = 0.0
         self.select_progress = 0.0
 
+        # 縮圖位置固定；名稱與難度文字依字型與選中狀態快取
+        self._thumb_rect = self.thumbnail.get_rect(
+            center=(self.rect.centerx, self.rect.y + self.rect.height * 0.38)
+        )
+        self._label_cache = {}
+
     def handle_event(self, event: pygame.event.Event) -> bool:
         """處理滑鼠事件，返回 True 表示被點擊"""
         if event.type == pygame.MOUSEMOTION:
@@ -508,6 +526,11 @@ class ShapeCard:
         small_font: pygame.font.Font,
     ):
         """繪製卡片"""
+        self.draw_frame(screen)
+        screen.blits(self.get_blits(font, small_font), doreturn=False)
+
+    def draw_frame(self, screen: pygame.Surface):
+        """繪製卡片背景與邊框"""
         rect = self.rect
 
         # 卡片背景顏色（根據選中/懸停狀態）
@@ -528,26 +551,37 @@ class ShapeCard:
         pygame.draw.rect(screen, bg_color, rect, border_radius=12)
         pygame.draw.rect(screen, border_color, rect, width=border_width, border_radius=12)
 
-        # 繪製縮圖（置中於卡片上半部）
-        thumb_rect = self.thumbnail.get_rect(
-            center=(rect.centerx, rect.y + rect.height * 0.38)
-        )
-        screen.blit(self.thumbnail, thumb_rect)
+    def get_blits(
+        self,
+        font: pygame.font.Font,
+        small_font: pygame.font.Font,
+    ) -> list:
+        """取得縮圖、名稱與難度的 (surface, rect) 清單，供呼叫端合併成單次 blits"""
+        key = (id(font), id(small_font), self.is_selected)
+        labels = self._label_cache.get(key)
+        if labels is None:
+            labels = self._render_labels(font, small_font)
+            self._label_cache[key] = labels
+        return [(self.thumbnail, self._thumb_rect), *labels]
+
+    def _render_labels(self, font: pygame.font.Font, small_font: pygame.font.Font) -> list:
+        """渲染名稱與難度星級文字"""
+        rect = self.rect
 
-        # 繪製圖形名稱
+        # 圖形名稱
         name_color = WHITE if self.is_selected else TEXT_PRIMARY
         name_surface = font.render(self.metadata["name"], True, name_color)
         name_rect = name_surface.get_rect(center=(rect.centerx, rect.y + rect.height * 0.72))
-        screen.blit(name_surface, name_rect)
 
-        # 繪製難度星級
+        # 難度星級
         difficulty = self.metadata["difficulty"]
         stars = "★" * difficulty + "☆" * (3 - difficulty)
         diff_text = f"難度: {stars}"
         diff_color = ACCENT_COLOR if self.is_selected else TEXT_MUTED
         diff_surface = small_font.render(diff_text, True, diff_color)
         diff_rect = diff_surface.get_rect(center=(rect.centerx, rect.y + rect.height * 0.88))
-        screen.blit(diff_surface, diff_rect)
+
+        return [(name_surface, name_rect), (diff_surface, diff_rect)]
 
 
 class TextInput:
@@ -5,8 +5,22 @@
 import pygame
 import math
 import random
+from bisect import bisect_right
 from .base import Scene, Button
 from ..config import *
+from ..utils.drawing import create_linear_gradient_surface
+
+
+# 晶圓光澤位置查表（2 度一格，共 180 格）
+_SHINE_TABLE = [
+    (math.cos(math.radians(i * 2)), math.sin(math.radians(i * 2))) for i in range(180)
+]
+
+
+def _build_comment_table(comments: dict) -> tuple:
+    """將 {門檻: 評語} 轉為 (遞增門檻, 對應評語) 查表"""
+    thresholds = tuple(sorted(comments))
+    return thresholds, tuple(comments[t] for t in thresholds)
 
 
 class ResultScene(Scene):
@@ -61,6 +75,21 @@ class ResultScene(Scene):
         0:  "良率偏低，需重新檢討製程參數。",
     }
 
+    # 預先建立評語查表（效能優化：以二分搜尋取代 if 鏈）
+    STAGE_COMMENT_TABLES = {
+        key: _build_comment_table(comments) for key, comments in STAGE_COMMENTS.items()
+    }
+    TOTAL_COMMENT_TABLE = _build_comment_table(TOTAL_COMMENTS)
+
+    # 等級對應顏色 (5級制)
+    GRADE_COLORS = {
+        "S": SECONDARY_COLOR,  # 綠色（頂尖）
+        "A": SECONDARY_COLOR,  # 綠色
+        "B": PRIMARY_COLOR,    # 藍色
+        "C": ACCENT_COLOR,     # 黃色
+        "D": DANGER_COLOR,     # 紅色
+    }
+
     def __init__(self, game):
         super().__init__(game)
 
@@ -73,6 +102,10 @@ class ResultScene(Scene):
         self.animation_progress = 0.0
         self.wafer_rotation = 0
 
+        # 動畫完成後的成績單快取（效能優化）
+        self._scores_cache_surf = None
+        self._cached_score_colors = []
+
         # UI 元件
         center_x = SCREEN_WIDTH // 2
         self.replay_button = Button(
@@ -102,16 +135,22 @@ class ResultScene(Scene):
         self.small_font = pygame.font.SysFont("Microsoft JhengHei", 18)
 
         # 預繪製漸層背景（效能優化）
-        self._gradient_surface = self.create_gradient_background((60, 75, 100), factor=0.4)
+        self._gradient_surface = create_linear_gradient_surface((20, 25, 40), (35, 45, 70))
 
         # 計算總分
         self._calculate_results()
 
+        # 各項分數進入場景後不再變動，預先決定顏色
+        self._cached_score_colors = [
+            self._score_color(self.game.scores.get(key, 0)) for key in self.SCORE_LABELS
+        ]
+
         # 儲存成績到排行榜
         self._save_to_leaderboard()
 
         # 重設動畫
         self.animation_progress = 0.0
+        self._scores_cache_surf = None
 
     def _calculate_results(self):
         """計算結果"""
@@ -144,18 +183,15 @@ class ResultScene(Scene):
         else:
             self.grade = "D"
 
-    def _get_comment(self, score: int, comments_dict: dict) -> str:
+    @staticmethod
+    def _score_color(score: int) -> tuple:
+        """根據分數決定顏色"""
+        return SECONDARY_COLOR if score >= 80 else PRIMARY_COLOR if score >= 60 else ACCENT_COLOR
+
+    def _get_comment(self, score: int, comment_table: tuple) -> str:
         """根據分數取得對應評語"""
-        if score >= 90:
-            return comments_dict[90]
-        elif score >= 80:
-            return comments_dict[80]
-        elif score >= 70:
-            return comments_dict[70]
-        elif score >= 60:
-            return comments_dict[60]
-        else:
-            return comments_dict[0]
+        thresholds, comments = comment_table
+        return comments[max(0, bisect_right(thresholds, score) - 1)]
 
     def _save_to_leaderboard(self):
         """儲存成績到排行榜資料庫"""
@@ -221,13 +257,8 @@ class ResultScene(Scene):
 
     def draw(self, screen: pygame.Surface):
         """繪製"""
-        # 背景漸層
-        for y in range(SCREEN_HEIGHT):
-            ratio = y / SCREEN_HEIGHT
-            r = int(20 + 15 * ratio)
-            g = int(25 + 20 * ratio)
-            b = int(40 + 30 * ratio)
-            pygame.draw.line(screen, (r, g, b), (0, y), (SCREEN_WIDTH, y))
+        # 背景漸層（使用預繪製的快取）
+        screen.blit(self._gradient_surface, (0, 0))
 
         # 標題
         self._draw_header(screen)
@@ -262,9 +293,21 @@ class ResultScene(Scene):
         screen.blit(subtitle, subtitle_rect)
 
     def _draw_scores(self, screen: pygame.Surface):
-        """繪製各項分數"""
-        start_x = 100
-        start_y = 150
+        """繪製各項分數（動畫完成後改用快取的整張成績單）"""
+        origin = (100, 150)
+        if self.animation_progress < 1.0:
+            self._render_scores(screen, *origin)
+            return
+
+        if self._scores_cache_surf is None:
+            self._scores_cache_surf = pygame.Surface(
+                (SCREEN_WIDTH - origin[0], len(self.SCORE_LABELS) * 60), pygame.SRCALPHA
+            )
+            self._render_scores(self._scores_cache_surf, 0, 0)
+        screen.blit(self._scores_cache_surf, origin)
+
+    def _render_scores(self, screen: pygame.Surface, start_x: int, start_y: int):
+        """繪製各項分數到指定 Surface"""
         bar_width = 300
         bar_height = 25
         spacing = 60
@@ -274,6 +317,7 @@ class ResultScene(Scene):
         for i, (key, label) in enumerate(self.SCORE_LABELS.items()):
             y = start_y + i * spacing
             score = scores.get(key, 0)
+            color = self._cached_score_colors[i]
             weight = SCORE_WEIGHTS[key] / 100  # 轉換為小數
 
             # 動畫進度
@@ -294,12 +338,6 @@ class ResultScene(Scene):
             # 進度條填充
             fill_width = int(bar_width * animated_score / 100)
             if fill_width > 0:
-                if score >= 80:
-                    color = SECONDARY_COLOR
-                elif score >= 60:
-                    color = PRIMARY_COLOR
-                else:
-                    color = ACCENT_COLOR
                 pygame.draw.rect(screen, color, (start_x, bar_y, fill_width, bar_height), border_radius=5)
 
             # 分數文字
@@ -309,16 +347,8 @@ class ResultScene(Scene):
 
             # 評語（動畫完成後才顯示）
             if self.animation_progress >= 0.8:
-                comment = self._get_comment(score, self.STAGE_COMMENTS[key])
-                # 根據分數決定顏色
-                if score >= 80:
-                    comment_color = SECONDARY_COLOR
-                elif score >= 60:
-                    comment_color = PRIMARY_COLOR
-                else:
-                    comment_color = ACCENT_COLOR
-
-                comment_text = self.small_font.render(comment, True, comment_color)
+                comment = self._get_comment(score, self.STAGE_COMMENT_TABLES[key])
+                comment_text = self.small_font.render(comment, True, color)
                 comment_rect = comment_text.get_rect(midleft=(start_x + bar_width + 100, bar_y + bar_height // 2))
                 screen.blit(comment_text, comment_rect)
 
@@ -341,14 +371,7 @@ class ResultScene(Scene):
         screen.blit(score_text, score_rect)
 
         # 等級 (5級制)
-        grade_colors = {
-            "S": SECONDARY_COLOR,  # 綠色（頂尖）
-            "A": SECONDARY_COLOR,  # 綠色
-            "B": PRIMARY_COLOR,    # 藍色
-            "C": ACCENT_COLOR,     # 黃色
-            "D": DANGER_COLOR,     # 紅色
-        }
-        grade_color = grade_colors.get(self.grade, WHITE)
+        grade_color = self.GRADE_COLORS.get(self.grade, WHITE)
 
         # 等級框
         grade_x = center_x + 150
@@ -390,10 +413,10 @@ class ResultScene(Scene):
                     y = wafer_y + j * 18
                     pygame.draw.rect(screen, chip_color, (x - 7, y - 7, 14, 14))
 
-        # 旋轉光澤效果
-        shine_angle = self.wafer_rotation * math.pi / 180
-        shine_x = wafer_x + int(math.cos(shine_angle) * radius * 0.7)
-        shine_y = wafer_y + int(math.sin(shine_angle) * radius * 0.7)
+        # 旋轉光澤效果（角度量化為 2 度查表）
+        cos_a, sin_a = _SHINE_TABLE[int(self.wafer_rotation // 2) % 180]
+        shine_x = wafer_x + int(cos_a * radius * 0.7)
+        shine_y = wafer_y + int(sin_a * radius * 0.7)
         pygame.draw.circle(screen, (255, 255, 255, 100), (shine_x, shine_y), 15)
 
         # 標籤
@@ -407,19 +430,10 @@ class ResultScene(Scene):
         y = 500
 
         # 使用 5 級評語系統
-        comment = self._get_comment(self.total_score, self.TOTAL_COMMENTS)
+        comment = self._get_comment(self.total_score, self.TOTAL_COMMENT_TABLE)
 
-        # 顏色對應
-        if self.total_score >= 90:
-            color = SECONDARY_COLOR  # 綠色
-        elif self.total_score >= 80:
-            color = SECONDARY_COLOR
-        elif self.total_score >= 70:
-            color = PRIMARY_COLOR    # 藍色
-        elif self.total_score >= 60:
-            color = ACCENT_COLOR     # 黃色
-        else:
-            color = DANGER_COLOR     # 紅色
+        # 顏色對應（與等級顏色一致）
+        color = self.GRADE_COLORS.get(self.grade, WHITE)
 
         # 只有動畫完成後才顯示
         if self.animation_progress >= 0.8:
@@ -6,10 +6,52 @@
 import pygame
 import math
 import random
+from collections import deque
+import numpy as np
 from .base import Scene, Button, ProgressBar
 from ..config import *
 
 
+# 多晶矽多邊形旋轉查表（旋轉角量化為 1 度）
+_POLY_ROTATIONS = 360
+
+
+def _build_poly_table(num_points: int = 8) -> tuple:
+    """預先計算每個量化旋轉角下的多邊形頂點偏移"""
+    table = []
+    for step in range(_POLY_ROTATIONS):
+        rotation = step * 2 * math.pi / _POLY_ROTATIONS
+        offsets = []
+        for i in range(num_points):
+            angle = (i / num_points) * 2 * math.pi + rotation
+            radius = 60 + math.sin(angle * 3) * 20
+            offsets.append((math.cos(angle) * radius, math.sin(angle) * radius))
+        table.append(tuple(offsets))
+    return tuple(table)
+
+
+_POLY_TABLE = _build_poly_table()
+
+# 多晶矽內部紋理線段偏移（角度固定，不隨旋轉）
+_POLY_INNER_LINES = tuple(
+    (math.cos(angle) * 20, math.sin(angle) * 20, math.cos(angle) * 50, math.sin(angle) * 50)
+    for angle in ((i / 5) * 2 * math.pi for i in range(5))
+)
+
+# 晶圓晶格點偏移（半徑 90，內縮 5 像素，間距 10）
+_WAFER_RADIUS = 90
+_WAFER_DOTS = tuple(
+    (i * 10, j * 10)
+    for i in range(-8, 9)
+    for j in range(-8, 9)
+    if (i * 10) ** 2 + (j * 10) ** 2 < (_WAFER_RADIUS - 5) ** 2
+)
+
+# 晶格點的像素座標偏移（半徑 1 的圓即左上 2x2 像素），供 surfarray 一次寫入
+_WAFER_DOT_XS = np.array([dx + ox for dx, _ in _WAFER_DOTS for ox in (-1, -1, 0, 0)])
+_WAFER_DOT_YS = np.array([dy + oy for _, dy in _WAFER_DOTS for oy in (-1, 0, -1, 0)])
+
+
 class MaterialStage(Scene):
     """材料準備關卡"""
 
@@ -26,6 +68,19 @@ class MaterialStage(Scene):
     MIN_SHAKE_THRESHOLD = 0.1   # 有效搖晃最低門檻
     SAMPLE_WINDOW = 50          # 均勻度計算樣本數
     VARIANCE_PENALTY = 300      # 變異度扣分係數（更嚴格）
+    IDLE_UPDATE_INTERVAL = 0.05 # 完成後背景動畫更新間隔（20 Hz）
+
+    # 環境粒子精靈（依尺寸與透明度分桶預繪製）
+    PARTICLE_COUNT = 30
+    PARTICLE_SIZES = (1, 2, 3)
+    PARTICLE_ALPHAS = (20, 33, 46, 60)
+
+    # 晶圓彩虹反射旋轉角量化數
+    RAINBOW_BUCKETS = 64
+
+    # 階段指示器
+    INDICATOR_SPACING = 100     # 節點間距
+    INDICATOR_NODE_RADIUS = 16  # 節點半徑
 
     def __init__(self, game):
         super().__init__(game)
@@ -33,15 +88,28 @@ class MaterialStage(Scene):
         # 遊戲狀態
         self.current_stage = 0
         self.energy = 0.0
-        self.shake_samples = []     # 搖晃強度樣本（計算均勻度）
+        self.shake_samples = deque(maxlen=self.SAMPLE_WINDOW)  # 搖晃強度樣本（計算均勻度）
+        self._sample_sum = 0.0      # 樣本總和（累計，O(1) 計算平均）
+        self._sample_sq_sum = 0.0   # 樣本平方和（累計，O(1) 計算變異數）
+        self._last_score_key = None # 上次計算分數時的樣本狀態
+        self._last_score = 50       # 上次計算的分數
         self.stage_scores = []      # 各階段分數
         self.is_complete = False
+        self._idle_accum = 0.0      # 完成後降頻更新的累積時間
+        self._sensor = None         # 綁定的感測器（on_enter 時設定）
+        self._surf_pool = {}        # 暫存圖層池（依尺寸重複使用）
 
         # 動畫
         self.particle_angle = 0     # 粒子旋轉角度
         self.glow_intensity = 0     # 發光強度
         self.heat_wave_phase = 0    # 熱浪效果相位
-        self.ambient_particles = [] # 環境粒子
+        # 環境粒子（SoA 陣列：位置、速度、尺寸，精靈另存清單）
+        self._ap_x = np.empty(0)
+        self._ap_y = np.empty(0)
+        self._ap_vx = np.empty(0)
+        self._ap_vy = np.empty(0)
+        self._ap_size = np.empty(0)
+        self._ap_sprites = []
 
         # UI 元件
         center_x = SCREEN_WIDTH // 2
@@ -61,6 +129,7 @@ class MaterialStage(Scene):
         self.title_font = None
         self.text_font = None
         self.small_font = None
+        self.num_font = None
 
     def on_enter(self):
         """進入場景"""
@@ -68,32 +137,94 @@ class MaterialStage(Scene):
         self.title_font = pygame.font.SysFont("Microsoft JhengHei", 42)
         self.text_font = pygame.font.SysFont("Microsoft JhengHei", 24)
         self.small_font = pygame.font.SysFont("Microsoft JhengHei", 18)
+        self.num_font = pygame.font.SysFont(
+            "Microsoft JhengHei", int(self.INDICATOR_NODE_RADIUS * 0.8), bold=True
+        )
+
+        # 預渲染階段編號文字（節點內的數字）
+        self._num_text_cache = [
+            self.num_font.render(str(i + 1), True, WHITE)
+            for i in range(len(self.STAGES))
+        ]
+
+        # 已完成節點勾選符號的折線偏移
+        check_size = int(self.INDICATOR_NODE_RADIUS * 0.5)
+        self._check_offsets = (
+            (-check_size, 0),
+            (-(check_size // 3), check_size * 0.6),
+            (check_size, -check_size * 0.5),
+        )
 
         # 預繪製所有階段的增強版漸層背景
         self._bg_surfaces = []
         for stage in self.STAGES:
             color = stage["color"]
             surf = self.create_enhanced_background(color, add_vignette=True, add_grid=True)
-            self._bg_surfaces.append(surf)
+            # 轉為顯示格式，逐幀 blit 時免去像素格式轉換
+            self._bg_surfaces.append(surf.convert())
+
+        # 預繪製沙粒（固定種子，內容不隨影格改變）
+        self._sand_surf = self._build_sand_surface(self.STAGES[0]["color"])
+
+        # 預繪製各材料的發光圖層（不透明，繪製時以 set_alpha 調整強度）
+        self._glow_sand = pygame.Surface((250, 150), pygame.SRCALPHA)
+        pygame.draw.ellipse(self._glow_sand, ACCENT_COLOR, (0, 0, 250, 150))
+        self._glow_poly = pygame.Surface((200, 200), pygame.SRCALPHA)
+        pygame.draw.circle(self._glow_poly, ACCENT_COLOR, (100, 100), 80)
+        self._glow_crystal = pygame.Surface((200, 250), pygame.SRCALPHA)
+        pygame.draw.ellipse(self._glow_crystal, ACCENT_COLOR, (0, 0, 200, 250))
+        self._glow_wafer = pygame.Surface((250, 250), pygame.SRCALPHA)
+        pygame.draw.circle(self._glow_wafer, SECONDARY_COLOR, (125, 125), 110)
+
+        # 預繪製目前節點的多層脈動光暈（以 set_alpha 調整脈動強度）
+        self._pulse_glow_base = self._build_pulse_glow_surface()
+
+        # 晶圓彩虹反射快取（依量化旋轉角）
+        self._arc_cache = {}
+
+        # 預繪製「已完成」連接線漸層條
+        self._done_line_surf = self._build_done_line_surface()
+
+        # 預繪製環境粒子精靈
+        self._particle_sprites = {
+            (size, alpha): self._build_particle_sprite(size, alpha)
+            for size in self.PARTICLE_SIZES
+            for alpha in self.PARTICLE_ALPHAS
+        }
 
         # 初始化環境粒子
-        self.ambient_particles = []
-        for _ in range(30):
-            self.ambient_particles.append({
-                'x': random.randint(0, SCREEN_WIDTH),
-                'y': random.randint(0, SCREEN_HEIGHT),
-                'vx': random.uniform(-10, 10),
-                'vy': random.uniform(-20, -5),
-                'size': random.uniform(1, 3),
-                'alpha': random.randint(20, 60)
-            })
+        count = self.PARTICLE_COUNT
+        self._ap_x = np.random.randint(0, SCREEN_WIDTH + 1, count).astype(np.float64)
+        self._ap_y = np.random.randint(0, SCREEN_HEIGHT + 1, count).astype(np.float64)
+        self._ap_vx = np.random.uniform(-10, 10, count)
+        self._ap_vy = np.random.uniform(-20, -5, count)
+        self._ap_size = np.random.uniform(1, 3, count)
+        alphas = np.random.randint(20, 61, count)
+        alpha_bins = np.rint((alphas - 20) / 40 * (len(self.PARTICLE_ALPHAS) - 1)).astype(int)
+        self._ap_sprites = [
+            self._particle_sprites[(int(size), self.PARTICLE_ALPHAS[alpha_bin])]
+            for size, alpha_bin in zip(self._ap_size, alpha_bins)
+        ]
+
+        # 各階段材料繪製函式（依 current_stage 索引）
+        self._material_fns = (
+            self._draw_sand,
+            self._draw_polysilicon,
+            self._draw_crystal,
+            self._draw_wafer,
+        )
 
         # 重置狀態
         self.current_stage = 0
+        self._current_color = self.STAGES[0]["color"]
         self.energy = 0.0
-        self.shake_samples = []
+        self._reset_samples()
         self.stage_scores = []
         self.is_complete = False
+        self._idle_accum = 0.0
+
+        # 綁定感測器（連線狀態仍逐次檢查，支援背景連線完成或斷線重連）
+        self._sensor = self.game.sensor
 
     def handle_event(self, event: pygame.event.Event):
         """處理事件"""
@@ -111,23 +242,76 @@ class MaterialStage(Scene):
 
     def _get_shake_intensity(self) -> float:
         """取得搖晃強度"""
-        if self.game.sensor and self.game.sensor.is_connected:
-            return self.game.sensor.get_shake_intensity()
+        sensor = self._sensor
+        if sensor is not None and sensor.is_connected:
+            return sensor.get_shake_intensity()
         return 0.0
 
+    @staticmethod
+    def _build_particle_sprite(size: int, alpha: int) -> pygame.Surface:
+        """預繪製單一環境粒子精靈"""
+        surf = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+        pygame.draw.circle(surf, (255, 255, 255, alpha), (size, size), size)
+        return surf
+
+    @staticmethod
+    def _build_sand_surface(color) -> pygame.Surface:
+        """預繪製沙粒圖層（250x150，中心為材料中心）"""
+        surf = pygame.Surface((250, 150), pygame.SRCALPHA)
+        rng = random.Random(42)  # 固定種子確保一致性
+        for _ in range(80):
+            offset_x = rng.randint(-100, 100)
+            offset_y = rng.randint(-60, 60)
+            size = rng.randint(3, 8)
+            pygame.draw.circle(surf, color, (125 + offset_x, 75 + offset_y), size)
+        return surf
+
+    def _build_pulse_glow_surface(self) -> pygame.Surface:
+        """預繪製目前節點的三層光暈（脈動強度為 1 時的樣貌）"""
+        outer_radius = self.INDICATOR_NODE_RADIUS + 16
+        surf = pygame.Surface((outer_radius * 2, outer_radius * 2), pygame.SRCALPHA)
+        for layer in range(3):
+            glow_radius = self.INDICATOR_NODE_RADIUS + 8 + layer * 4
+            glow_alpha = int(60 * (3 - layer) / 3)
+            layer_surf = pygame.Surface((glow_radius * 2, glow_radius * 2), pygame.SRCALPHA)
+            pygame.draw.circle(layer_surf, (*ACCENT_COLOR, glow_alpha),
+                               (glow_radius, glow_radius), glow_radius)
+            offset = outer_radius - glow_radius
+            surf.blit(layer_surf, (offset, offset))
+        return surf
+
+    def _build_done_line_surface(self) -> pygame.Surface:
+        """預繪製已完成連接線的漸層條（SECONDARY → GLOW_GREEN）"""
+        length = self.INDICATOR_SPACING - self.INDICATOR_NODE_RADIUS * 2 - 10
+        surf = pygame.Surface((length + 1, 3))
+        start_color = pygame.Color(SECONDARY_COLOR)
+        end_color = pygame.Color(GLOW_GREEN)
+        for lx in range(length + 1):
+            t = min(lx, length - 1) / max(1, length)
+            surf.fill(start_color.lerp(end_color, t), (lx, 0, 1, 3))
+        return surf
+
     def _calculate_purity_score(self) -> int:
         """計算純度分數（0-100）- 基於搖晃均勻度"""
-        if len(self.shake_samples) < 10:
+        n = len(self.shake_samples)
+        if n < 10:
             return 50  # 樣本太少，給基本分
 
-        # 計算標準差
-        mean = sum(self.shake_samples) / len(self.shake_samples)
-        variance = sum((x - mean) ** 2 for x in self.shake_samples) / len(self.shake_samples)
+        # 樣本未變動時直接回傳上次結果
+        score_key = (n, self._sample_sum, self._sample_sq_sum)
+        if score_key == self._last_score_key:
+            return self._last_score
+
+        # 計算標準差（Var[X] = E[X²] - E[X]²，使用累計和）
+        mean = self._sample_sum / n
+        variance = max(0.0, self._sample_sq_sum / n - mean * mean)
         std_dev = variance ** 0.5
 
         # 均勻度分數（標準差越小分數越高）
-        score = max(0, 100 - std_dev * self.VARIANCE_PENALTY)
-        return int(score)
+        score = int(max(0, 100 - std_dev * self.VARIANCE_PENALTY))
+        self._last_score_key = score_key
+        self._last_score = score
+        return score
 
     def _advance_stage(self):
         """進入下一階段"""
@@ -136,7 +320,7 @@ class MaterialStage(Scene):
         self.stage_scores.append(score)
 
         # 清空樣本，重置能量
-        self.shake_samples = []
+        self._reset_samples()
         self.energy = 0.0
         self.progress_bar.reset()  # 立即重置進度條（無動畫）
         self.current_stage += 1
@@ -147,6 +331,14 @@ class MaterialStage(Scene):
             self.is_complete = True
             self._save_score()
 
+        self._current_color = self.STAGES[self.current_stage]["color"]
+
+    def _reset_samples(self):
+        """清空搖晃樣本與累計和"""
+        self.shake_samples = deque(maxlen=self.SAMPLE_WINDOW)
+        self._sample_sum = 0.0
+        self._sample_sq_sum = 0.0
+
     def _save_score(self):
         """儲存純度分數"""
         if self.stage_scores:
@@ -165,6 +357,15 @@ class MaterialStage(Scene):
         # 更新按鈕動畫
         self.next_button.update(dt)
 
+        if self.is_complete:
+            # 完成畫面只剩背景動畫，降頻更新（累積時間後一次推進）
+            self._idle_accum += dt
+            if self._idle_accum >= self.IDLE_UPDATE_INTERVAL:
+                self._update_ambient_particles(self._idle_accum)
+                self.heat_wave_phase += self._idle_accum * 2
+                self._idle_accum = 0.0
+            return
+
         # 更新進度條動畫
         self.progress_bar.update(dt)
 
@@ -174,9 +375,6 @@ class MaterialStage(Scene):
         # 更新熱浪相位
         self.heat_wave_phase += dt * 2
 
-        if self.is_complete:
-            return
-
         # 取得搖晃強度
         intensity = self._get_shake_intensity()
 
@@ -188,11 +386,16 @@ class MaterialStage(Scene):
         # 累積能量
         if intensity > self.MIN_SHAKE_THRESHOLD:
             self.energy += intensity * dt * self.ENERGY_SPEED
-            self.shake_samples.append(intensity)
 
-            # 限制樣本數量
-            if len(self.shake_samples) > self.SAMPLE_WINDOW:
-                self.shake_samples.pop(0)
+            # 環形緩衝區已滿時，append 會自動移出最舊樣本，先從累計和扣除
+            if len(self.shake_samples) == self.SAMPLE_WINDOW:
+                oldest = self.shake_samples[0]
+                self._sample_sum -= oldest
+                self._sample_sq_sum -= oldest * oldest
+
+            self.shake_samples.append(intensity)
+            self._sample_sum += intensity
+            self._sample_sq_sum += intensity * intensity
 
         # 更新進度條
         self.progress_bar.set_progress(self.energy)
@@ -202,19 +405,19 @@ class MaterialStage(Scene):
             self._advance_stage()
 
     def _update_ambient_particles(self, dt: float):
-        """更新環境粒子"""
-        for p in self.ambient_particles:
-            p['x'] += p['vx'] * dt
-            p['y'] += p['vy'] * dt
-
-            # 循環
-            if p['y'] < -10:
-                p['y'] = SCREEN_HEIGHT + 10
-                p['x'] = random.randint(0, SCREEN_WIDTH)
-            if p['x'] < -10:
-                p['x'] = SCREEN_WIDTH + 10
-            elif p['x'] > SCREEN_WIDTH + 10:
-                p['x'] = -10
+        """更新環境粒子（NumPy 向量化）"""
+        x = self._ap_x
+        y = self._ap_y
+        x += self._ap_vx * dt
+        y += self._ap_vy * dt
+
+        # 循環
+        wrapped = y < -10
+        if wrapped.any():
+            y[wrapped] = SCREEN_HEIGHT + 10
+            x[wrapped] = np.random.randint(0, SCREEN_WIDTH + 1, int(wrapped.sum()))
+        x[x < -10] = SCREEN_WIDTH + 10
+        x[x > SCREEN_WIDTH + 10] = -10
 
     def draw(self, screen: pygame.Surface):
         """繪製場景"""
@@ -240,7 +443,7 @@ class MaterialStage(Scene):
         # 提示文字
         if not self.is_complete:
             hint = "搖晃裝置來轉化材料！"
-            hint_surface = self.text_font.render(hint, True, TEXT_SECONDARY)
+            hint_surface = self.render_text(self.text_font, hint, TEXT_SECONDARY)
             hint_rect = hint_surface.get_rect(center=(SCREEN_WIDTH // 2, 470))
             screen.blit(hint_surface, hint_rect)
 
@@ -253,7 +456,7 @@ class MaterialStage(Scene):
                 percent_color = ACCENT_LIGHT
             else:
                 percent_color = WHITE
-            percent_surface = self.text_font.render(percent_text, True, percent_color)
+            percent_surface = self.render_text(self.text_font, percent_text, percent_color)
             percent_rect = percent_surface.get_rect(center=(SCREEN_WIDTH // 2, 580))
             screen.blit(percent_surface, percent_rect)
 
@@ -262,13 +465,13 @@ class MaterialStage(Scene):
             avg_score = sum(self.stage_scores) / len(self.stage_scores) if self.stage_scores else 0
 
             # 分數光暈
-            glow_surf = pygame.Surface((300, 60), pygame.SRCALPHA)
+            glow_surf = self._scratch(300, 60)
             glow_alpha = int(30 + 20 * math.sin(self.heat_wave_phase * 2))
             pygame.draw.ellipse(glow_surf, (*SECONDARY_COLOR, glow_alpha), (0, 0, 300, 60))
             screen.blit(glow_surf, (SCREEN_WIDTH // 2 - 150, 500))
 
             score_text = f"純度評分: {int(avg_score)} 分"
-            score_surface = self.title_font.render(score_text, True, SECONDARY_COLOR)
+            score_surface = self.render_text(self.title_font, score_text, SECONDARY_COLOR)
             score_rect = score_surface.get_rect(center=(SCREEN_WIDTH // 2, 520))
             screen.blit(score_surface, score_rect)
 
@@ -279,12 +482,10 @@ class MaterialStage(Scene):
         self.draw_fade_overlay(screen)
 
     def _draw_ambient_particles(self, screen: pygame.Surface):
-        """繪製環境粒子"""
-        for p in self.ambient_particles:
-            surf = pygame.Surface((int(p['size'] * 2), int(p['size'] * 2)), pygame.SRCALPHA)
-            pygame.draw.circle(surf, (255, 255, 255, p['alpha']),
-                             (int(p['size']), int(p['size'])), int(p['size']))
-            screen.blit(surf, (int(p['x'] - p['size']), int(p['y'] - p['size'])))
+        """繪製環境粒子（預繪製精靈，單次批次 blit）"""
+        xs = (self._ap_x - self._ap_size).astype(int).tolist()
+        ys = (self._ap_y - self._ap_size).astype(int).tolist()
+        screen.blits(list(zip(self._ap_sprites, zip(xs, ys))), doreturn=False)
 
     def _draw_background(self, screen: pygame.Surface):
         """繪製漸層背景（使用預繪製的快取）"""
@@ -294,9 +495,9 @@ class MaterialStage(Scene):
         """繪製增強版階段進度指示器"""
         center_x = SCREEN_WIDTH // 2
         y = 110
-        spacing = 100
+        spacing = self.INDICATOR_SPACING
         start_x = center_x - (len(self.STAGES) - 1) * spacing // 2
-        node_radius = 16
+        node_radius = self.INDICATOR_NODE_RADIUS
 
         for i, stage in enumerate(self.STAGES):
             x = start_x + i * spacing
@@ -306,13 +507,8 @@ class MaterialStage(Scene):
                 line_start_x = x + node_radius + 5
                 line_end_x = x + spacing - node_radius - 5
                 if i < self.current_stage:
-                    # 已完成 - 漸層綠色
-                    for lx in range(line_start_x, line_end_x):
-                        t = (lx - line_start_x) / max(1, line_end_x - line_start_x)
-                        r = int(SECONDARY_COLOR[0] + (GLOW_GREEN[0] - SECONDARY_COLOR[0]) * t)
-                        g = int(SECONDARY_COLOR[1] + (GLOW_GREEN[1] - SECONDARY_COLOR[1]) * t)
-                        b = int(SECONDARY_COLOR[2] + (GLOW_GREEN[2] - SECONDARY_COLOR[2]) * t)
-                        pygame.draw.line(screen, (r, g, b), (lx, y), (lx + 1, y), 3)
+                    # 已完成 - 漸層綠色（預繪製的漸層條）
+                    screen.blit(self._done_line_surf, (line_start_x, y - 1))
                 else:
                     # 未完成 - 虛線
                     dash_length = 8
@@ -324,7 +520,7 @@ class MaterialStage(Scene):
             if i < self.current_stage:
                 # 已完成 - 綠色帶勾
                 # 光暈
-                glow_surf = pygame.Surface((node_radius * 3, node_radius * 3), pygame.SRCALPHA)
+                glow_surf = self._scratch(node_radius * 3, node_radius * 3)
                 pygame.draw.circle(glow_surf, (*GLOW_GREEN, 40),
                                  (node_radius * 1.5, node_radius * 1.5), node_radius + 5)
                 screen.blit(glow_surf, (x - node_radius * 1.5, y - node_radius * 1.5))
@@ -333,26 +529,18 @@ class MaterialStage(Scene):
                 pygame.draw.circle(screen, WHITE, (x, y), node_radius, 2)
 
                 # 勾選
-                check_size = int(node_radius * 0.5)
-                points = [
-                    (x - check_size, y),
-                    (x - check_size // 3, y + check_size * 0.6),
-                    (x + check_size, y - check_size * 0.5)
-                ]
+                points = [(x + ox, y + oy) for ox, oy in self._check_offsets]
                 pygame.draw.lines(screen, WHITE, False, points, 3)
 
             elif i == self.current_stage:
                 # 當前 - 脈動效果
                 pulse = 0.7 + 0.3 * math.sin(self.heat_wave_phase * 3)
 
-                # 多層光暈
-                for layer in range(3):
-                    glow_radius = node_radius + 8 + layer * 4
-                    glow_alpha = int(60 * pulse * (3 - layer) / 3)
-                    glow_surf = pygame.Surface((glow_radius * 2, glow_radius * 2), pygame.SRCALPHA)
-                    pygame.draw.circle(glow_surf, (*ACCENT_COLOR, glow_alpha),
-                                     (glow_radius, glow_radius), glow_radius)
-                    screen.blit(glow_surf, (x - glow_radius, y - glow_radius))
+                # 多層光暈（預繪製，依脈動調整透明度）
+                glow_surf = self._pulse_glow_base
+                glow_surf.set_alpha(int(255 * pulse))
+                half = glow_surf.get_width() // 2
+                screen.blit(glow_surf, (x - half, y - half))
 
                 pygame.draw.circle(screen, ACCENT_COLOR, (x, y), node_radius)
 
@@ -364,8 +552,7 @@ class MaterialStage(Scene):
                 pygame.draw.circle(screen, WHITE, (x, y), node_radius, 2)
 
                 # 數字
-                num_font = pygame.font.SysFont("Microsoft JhengHei", int(node_radius * 0.8), bold=True)
-                num_text = num_font.render(str(i + 1), True, WHITE)
+                num_text = self._num_text_cache[i]
                 num_rect = num_text.get_rect(center=(x, y))
                 screen.blit(num_text, num_rect)
 
@@ -382,83 +569,56 @@ class MaterialStage(Scene):
             else:
                 name_color = TEXT_MUTED
 
-            name_surface = self.small_font.render(stage["name"], True, name_color)
+            name_surface = self.render_text(self.small_font, stage["name"], name_color)
             name_rect = name_surface.get_rect(center=(x, y + 35))
             screen.blit(name_surface, name_rect)
 
     def _draw_material(self, screen: pygame.Surface):
         """繪製材料視覺化"""
-        center_x = SCREEN_WIDTH // 2
-        center_y = 300
-        current_color = self.STAGES[self.current_stage]["color"]
-
-        if self.current_stage == 0:
-            # 沙子：散落的顆粒
-            self._draw_sand(screen, center_x, center_y, current_color)
-        elif self.current_stage == 1:
-            # 多晶矽：不規則多邊形
-            self._draw_polysilicon(screen, center_x, center_y, current_color)
-        elif self.current_stage == 2:
-            # 單晶矽晶柱：圓柱體
-            self._draw_crystal(screen, center_x, center_y, current_color)
-        else:
-            # 晶圓：圓形薄片
-            self._draw_wafer(screen, center_x, center_y, current_color)
+        # 沙子：散落的顆粒 / 多晶矽：不規則多邊形 / 單晶矽晶柱：圓柱體 / 晶圓：圓形薄片
+        self._material_fns[self.current_stage](
+            screen, SCREEN_WIDTH // 2, 300, self._current_color
+        )
 
     def _draw_sand(self, screen, cx, cy, color):
-        """繪製沙子"""
-        import random
-        random.seed(42)  # 固定種子確保一致性
-
-        for _ in range(80):
-            offset_x = random.randint(-100, 100)
-            offset_y = random.randint(-60, 60)
-            size = random.randint(3, 8)
-
-            # 根據動畫角度微調位置
-            angle_offset = math.sin(self.particle_angle * 0.02 + offset_x * 0.1) * 3
-            x = cx + offset_x + angle_offset
-            y = cy + offset_y
-
-            pygame.draw.circle(screen, color, (int(x), int(y)), size)
+        """繪製沙子（預繪製圖層，整體隨動畫角度微幅左右晃動）"""
+        angle_offset = int(math.sin(self.particle_angle * 0.02) * 3)
+        screen.blit(self._sand_surf, (cx - 125 + angle_offset, cy - 75))
 
         # 發光效果
+        self._blit_glow(screen, self._glow_sand, 50, (cx - 125, cy - 75))
+
+    def _scratch(self, width: int, height: int) -> pygame.Surface:
+        """取得依尺寸重複使用的暫存 SRCALPHA 圖層（已清空）"""
+        surf = self._surf_pool.get((width, height))
+        if surf is None:
+            surf = pygame.Surface((width, height), pygame.SRCALPHA)
+            self._surf_pool[(width, height)] = surf
+        else:
+            surf.fill((0, 0, 0, 0))
+        return surf
+
+    def _blit_glow(self, screen, glow_surf, max_alpha, pos):
+        """以目前發光強度繪製預繪製的發光圖層"""
         if self.glow_intensity > 0:
-            glow_surf = pygame.Surface((250, 150), pygame.SRCALPHA)
-            glow_color = (*ACCENT_COLOR, int(50 * self.glow_intensity))
-            pygame.draw.ellipse(glow_surf, glow_color, (0, 0, 250, 150))
-            screen.blit(glow_surf, (cx - 125, cy - 75))
+            glow_surf.set_alpha(int(max_alpha * self.glow_intensity))
+            screen.blit(glow_surf, pos)
 
     def _draw_polysilicon(self, screen, cx, cy, color):
         """繪製多晶矽"""
-        # 不規則多邊形
-        points = []
-        num_points = 8
-        for i in range(num_points):
-            angle = (i / num_points) * 2 * math.pi + self.particle_angle * 0.01
-            radius = 60 + math.sin(angle * 3) * 20
-            x = cx + math.cos(angle) * radius
-            y = cy + math.sin(angle) * radius
-            points.append((x, y))
+        # 不規則多邊形（旋轉角量化後查表）
+        step = int(self.particle_angle * 0.01 / (2 * math.pi) * _POLY_ROTATIONS) % _POLY_ROTATIONS
+        points = [(cx + ox, cy + oy) for ox, oy in _POLY_TABLE[step]]
 
         pygame.draw.polygon(screen, color, points)
         pygame.draw.polygon(screen, WHITE, points, 2)
 
         # 內部紋理（表示多晶結構）
-        for i in range(5):
-            angle = (i / 5) * 2 * math.pi
-            x1 = cx + math.cos(angle) * 20
-            y1 = cy + math.sin(angle) * 20
-            x2 = cx + math.cos(angle) * 50
-            y2 = cy + math.sin(angle) * 50
-            pygame.draw.line(screen, DARK_GRAY, (x1, y1), (x2, y2), 1)
+        for x1, y1, x2, y2 in _POLY_INNER_LINES:
+            pygame.draw.line(screen, DARK_GRAY, (cx + x1, cy + y1), (cx + x2, cy + y2), 1)
 
         # 發光效果
-        if self.glow_intensity > 0:
-            glow_surf = pygame.Surface((200, 200), pygame.SRCALPHA)
-            glow_color = (*ACCENT_COLOR, int(60 * self.glow_intensity))
-            pygame.draw.circle(glow_surf, glow_color, (100, 100), 80)
-            screen.blit(glow_surf, (cx - 100, cy - 100))
+        self._blit_glow(screen, self._glow_poly, 60, (cx - 100, cy - 100))
 
     def _draw_crystal(self, screen, cx, cy, color):
         """繪製單晶矽晶柱"""
@@ -486,33 +646,37 @@ class MaterialStage(Scene):
         pygame.draw.line(screen, WHITE, (cx + width // 2, cy - height // 2), (cx + width // 2, cy + height // 2), 2)
 
         # 發光效果
-        if self.glow_intensity > 0:
-            glow_surf = pygame.Surface((200, 250), pygame.SRCALPHA)
-            glow_color = (*ACCENT_COLOR, int(50 * self.glow_intensity))
-            pygame.draw.ellipse(glow_surf, glow_color, (0, 0, 200, 250))
-            screen.blit(glow_surf, (cx - 100, cy - 125))
+        self._blit_glow(screen, self._glow_crystal, 50, (cx - 100, cy - 125))
+
+    def _build_rainbow_arc_surface(self, bucket: int, radius: int) -> pygame.Surface:
+        """繪製指定旋轉角的彩虹反射弧線圖層"""
+        surf = pygame.Surface((radius * 2 + 4, radius * 2 + 4), pygame.SRCALPHA)
+        arc_rect = pygame.Rect(12, 12, (radius - 10) * 2, (radius - 10) * 2)
+        rotation = bucket / self.RAINBOW_BUCKETS * 2 * math.pi
+        for i, rainbow_color in enumerate(WAFER_RAINBOW):
+            angle = (i / len(WAFER_RAINBOW)) * 2 * math.pi + rotation
+            pygame.draw.arc(surf, rainbow_color, arc_rect, angle, angle + 0.5, 3)
+        return surf
 
     def _draw_wafer(self, screen, cx, cy, color):
         """繪製晶圓"""
-        radius = 90
+        radius = _WAFER_RADIUS
 
         # 主圓
         pygame.draw.circle(screen, color, (cx, cy), radius)
 
-        # 彩虹反射效果（晶圓特有的）
-        for i, rainbow_color in enumerate(WAFER_RAINBOW):
-            angle = (i / len(WAFER_RAINBOW)) * 2 * math.pi + self.particle_angle * 0.02
-            arc_rect = pygame.Rect(cx - radius + 10, cy - radius + 10, (radius - 10) * 2, (radius - 10) * 2)
-            pygame.draw.arc(screen, rainbow_color, arc_rect, angle, angle + 0.5, 3)
-
-        # 晶格圖案
-        for i in range(-8, 9):
-            for j in range(-8, 9):
-                x = cx + i * 10
-                y = cy + j * 10
-                dist = math.sqrt((x - cx) ** 2 + (y - cy) ** 2)
-                if dist < radius - 5:
-                    pygame.draw.circle(screen, DARK_GRAY, (x, y), 1)
+        # 彩虹反射效果（晶圓特有的，依量化旋轉角快取）
+        bucket = int((self.particle_angle * 0.02) % (2 * math.pi) / (2 * math.pi) * self.RAINBOW_BUCKETS)
+        arc_surf = self._arc_cache.get(bucket)
+        if arc_surf is None:
+            arc_surf = self._build_rainbow_arc_surface(bucket, radius)
+            self._arc_cache[bucket] = arc_surf
+        screen.blit(arc_surf, (cx - radius - 2, cy - radius - 2))
+
+        # 晶格圖案（晶圓內的點位已預先篩選，以 surfarray 一次寫入所有像素）
+        pixels = pygame.surfarray.pixels3d(screen)
+        pixels[_WAFER_DOT_XS + cx, _WAFER_DOT_YS + cy] = DARK_GRAY
+        del pixels
 
         # 邊框
         pygame.draw.circle(screen, WHITE, (cx, cy), radius, 3)
@@ -527,8 +691,4 @@ class MaterialStage(Scene):
         pygame.draw.polygon(screen, (30, 40, 60), flat_points)
 
         # 發光效果
-        if self.glow_intensity > 0:
-            glow_surf = pygame.Surface((250, 250), pygame.SRCALPHA)
-            glow_color = (*SECONDARY_COLOR, int(40 * self.glow_intensity))
-            pygame.draw.circle(glow_surf, glow_color, (125, 125), 110)
-            screen.blit(glow_surf, (cx - 125, cy - 125))
+        self._blit_glow(screen, self._glow_wafer, 40, (cx - 125, cy - 125))
@@ -7,11 +7,20 @@
 import pygame
 import math
 import random
+import numpy as np
 from .base import Scene, Button, ProgressBar
 from ..config import *
 from ..utils.cv_scoring import CircleSimilarityScorer
 
 
+# 噴灑粒子結構化陣列欄位
+_SPRAY_DTYPE = np.dtype([
+    ('x', np.float32), ('y', np.float32),
+    ('vx', np.float32), ('vy', np.float32),
+    ('life', np.float32), ('size', np.float32),
+])
+
+
 class DepositionStage(Scene):
     """薄膜沉積關卡 - 傾斜畫圓"""
 
@@ -25,12 +34,24 @@ class DepositionStage(Scene):
     GYRO_MAX = 2000               # 最大有效值
     CURSOR_MAX_SPEED = 300.0      # 最大移動速度（像素/秒）
     CURSOR_MIN_SPEED = 50.0       # 最小移動速度（像素/秒）
+    GYRO_SPEED_SCALE = (CURSOR_MAX_SPEED - CURSOR_MIN_SPEED) / (GYRO_MAX - GYRO_DEADZONE)
 
     # 圓形參數
     TARGET_RADIUS = 150           # 目標圓半徑（像素）
     TRAIL_POINT_INTERVAL = 5      # 軌跡點間隔（像素）
+    TRAIL_POINT_INTERVAL_SQ = TRAIL_POINT_INTERVAL ** 2
+    TRAIL_BUFFER_SIZE = 4096      # 軌跡點緩衝區初始容量
+    CURSOR_GLYPH_SIZE = 32        # 噴頭圖示尺寸（像素）
     MIN_POINTS_FOR_SCORE = 20     # 最小計分點數
 
+    # 目標虛線圓
+    NUM_DASHES = 36               # 虛線段數（偶數段繪製）
+    DASH_PHASES = 32              # 旋轉相位量化數（一個虛線週期內）
+
+    # 噴灑粒子
+    SPRAY_CAPACITY = 64           # 預先配置的粒子數上限
+    SPRAY_MAX_ACTIVE = 15         # 同時存在粒子數達此值即停止產生
+
     def __init__(self, game):
         super().__init__(game)
 
@@ -42,6 +63,7 @@ class DepositionStage(Scene):
         self.cursor_y = SCREEN_HEIGHT // 2
         self.cursor_velocity_x = 0.0
         self.cursor_velocity_y = 0.0
+        self._cursor_speed = 0.0        # 游標速率（每幀於 _update_cursor 更新）
 
         # 目標圓（畫面中央）
         self.target_center = (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
@@ -49,8 +71,12 @@ class DepositionStage(Scene):
 
         # 繪製狀態
         self.is_drawing = False
-        self.drawn_points = []
+        self._pts_buf = np.empty((self.TRAIL_BUFFER_SIZE, 2), dtype=np.int32)  # 軌跡點緩衝區
+        self._pts_n = 0                 # 已記錄的軌跡點數
         self.last_recorded_pos = None
+        self._result_points = []        # 結果畫面用的平移後軌跡（進入結果階段時計算）
+        self._trail_surface = None      # 軌跡圖層（記錄新點時只畫新線段）
+        self._trail_bounds = None       # 軌跡圖層已繪製範圍
 
         # 分數
         self.similarity_score = 0
@@ -58,8 +84,17 @@ class DepositionStage(Scene):
         self.circularity_score = 0
         self.completeness_score = 0
 
+        # 環境粒子（SoA 陣列：位置、速度、尺寸，預繪製圖形另存清單）
+        self._ap_x = np.empty(0)
+        self._ap_y = np.empty(0)
+        self._ap_vx = np.empty(0)
+        self._ap_vy = np.empty(0)
+        self._ap_size = np.empty(0)
+        self._ap_glyphs = []
+
         # 動畫
-        self.spray_particles = []
+        self._spray = np.zeros(self.SPRAY_CAPACITY, dtype=_SPRAY_DTYPE)  # 噴灑粒子（前 _spray_n 筆有效）
+        self._spray_n = 0
         self.dash_offset = 0
 
         # OpenCV 評分器
@@ -109,17 +144,28 @@ class DepositionStage(Scene):
         # 預繪製增強版漸層背景
         self._bg_surface = self.create_enhanced_background(SILICON_BLUE, add_vignette=True, add_grid=False)
 
-        # 初始化環境粒子
-        self.ambient_particles = []
-        for _ in range(25):
-            self.ambient_particles.append({
-                'x': random.randint(0, SCREEN_WIDTH),
-                'y': random.randint(0, SCREEN_HEIGHT),
-                'vx': random.uniform(-8, 8),
-                'vy': random.uniform(-15, -3),
-                'size': random.uniform(1, 2.5),
-                'alpha': random.randint(15, 40)
-            })
+        # 初始化環境粒子（SoA 陣列）
+        count = 25
+        self._ap_x = np.random.randint(0, SCREEN_WIDTH + 1, count).astype(np.float64)
+        self._ap_y = np.random.randint(0, SCREEN_HEIGHT + 1, count).astype(np.float64)
+        self._ap_vx = np.random.uniform(-8, 8, count)
+        self._ap_vy = np.random.uniform(-15, -3, count)
+        # 尺寸量化至 0.5 像素、透明度量化至 8 階，同組粒子共用預繪製圖形
+        self._ap_size = np.round(np.random.uniform(1, 2.5, count) * 2) / 2
+        alphas = np.round(np.random.randint(15, 41, count) / 8).astype(int) * 8
+        glyph_cache = {}
+        self._ap_glyphs = []
+        for size, alpha in zip(self._ap_size.tolist(), alphas.tolist()):
+            glyph = glyph_cache.get((size, alpha))
+            if glyph is None:
+                glyph = pygame.Surface((int(size * 2), int(size * 2)), pygame.SRCALPHA)
+                pygame.draw.circle(glyph, (200, 220, 255, alpha),
+                                   (int(size), int(size)), int(size))
+                glyph_cache[(size, alpha)] = glyph
+            self._ap_glyphs.append(glyph)
+
+        # 軌跡圖層（需在 _reset_trail 之前建立）
+        self._trail_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
 
         # 重置狀態
         self.phase = self.PHASE_INSTRUCTIONS
@@ -127,16 +173,46 @@ class DepositionStage(Scene):
         self.cursor_y = SCREEN_HEIGHT // 2
         self.cursor_velocity_x = 0.0
         self.cursor_velocity_y = 0.0
+        self._cursor_speed = 0.0
         self.is_drawing = False
-        self.drawn_points = []
-        self.last_recorded_pos = None
+        self._reset_trail()
         self.similarity_score = 0
-        self.spray_particles = []
+        self._spray_n = 0
         self.drawing_elapsed = 0.0
 
         # 動畫狀態
         self.glow_phase = 0.0
 
+        # 噴灑粒子圖形查表（半徑 1~6，不透明，繪製時以 set_alpha 淡出）
+        self._spray_glyphs = [None]
+        for radius in range(1, 7):
+            glyph = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+            pygame.draw.circle(glyph, SILICON_BLUE, (radius, radius), radius)
+            self._spray_glyphs.append(glyph)
+
+        # 虛線端點角度查表（偶數段起點與終點的 cos/sin）
+        dash_angle = 2 * math.pi / self.NUM_DASHES
+        start_angles = np.arange(0, self.NUM_DASHES, 2) * dash_angle
+        end_angles = start_angles + dash_angle * 0.7
+        self._dash_start_cos = np.cos(start_angles)
+        self._dash_start_sin = np.sin(start_angles)
+        self._dash_end_cos = np.cos(end_angles)
+        self._dash_end_sin = np.sin(end_angles)
+
+        # 陀螺儀 → 游標速度查表（索引 = 讀值 + GYRO_MAX）
+        self._gyro_lut = tuple(
+            self._gyro_to_speed(g) for g in range(-self.GYRO_MAX, self.GYRO_MAX + 1)
+        )
+
+        # 預繪製噴頭圖示（低速 / 高速內圈顏色各一）
+        self._cursor_slow = self._build_cursor_surface(PRIMARY_COLOR)
+        self._cursor_fast = self._build_cursor_surface(SECONDARY_COLOR)
+
+        # 預繪製各旋轉相位的目標虛線圓
+        self._dash_cache = [
+            self._build_target_circle_surface(phase) for phase in range(self.DASH_PHASES)
+        ]
+
         # 初始化 OpenCV 評分器
         self.cv_scorer = CircleSimilarityScorer(
             canvas_size=(SCREEN_WIDTH, SCREEN_HEIGHT),
@@ -174,8 +250,7 @@ class DepositionStage(Scene):
                 self._finish_drawing()
             elif event.key == pygame.K_r:
                 # 重置繪製
-                self.drawn_points = []
-                self.last_recorded_pos = None
+                self._reset_trail()
 
     def _handle_result_event(self, event: pygame.event.Event):
         """結果階段事件處理"""
@@ -190,8 +265,7 @@ class DepositionStage(Scene):
         """開始繪製階段"""
         self.phase = self.PHASE_DRAWING
         self.is_drawing = True
-        self.drawn_points = []
-        self.last_recorded_pos = None
+        self._reset_trail()
         self.drawing_elapsed = 0.0
 
         # 游標起始位置（目標圓右側）
@@ -203,6 +277,10 @@ class DepositionStage(Scene):
         self.is_drawing = False
         self.similarity_score = self._calculate_similarity_score()
         self.game.scores["uniformity"] = self.similarity_score
+
+        # 結果畫面右側顯示的軌跡（平移至右側居中，結果階段中不再變動）
+        offset_x = 2 * SCREEN_WIDTH // 3 - self.target_center[0]
+        self._result_points = (self._pts_buf[:self._pts_n] + (offset_x, 0)).tolist()
         self.phase = self.PHASE_RESULT
 
     def _finish_stage(self):
@@ -237,17 +315,18 @@ class DepositionStage(Scene):
             self._update_result_phase(dt)
 
     def _update_ambient_particles(self, dt: float):
-        """更新環境粒子"""
-        for p in self.ambient_particles:
-            p['x'] += p['vx'] * dt
-            p['y'] += p['vy'] * dt
-            if p['y'] < -10:
-                p['y'] = SCREEN_HEIGHT + 10
-                p['x'] = random.randint(0, SCREEN_WIDTH)
-            if p['x'] < -10:
-                p['x'] = SCREEN_WIDTH + 10
-            elif p['x'] > SCREEN_WIDTH + 10:
-                p['x'] = -10
+        """更新環境粒子（NumPy 向量化）"""
+        x = self._ap_x
+        y = self._ap_y
+        x += self._ap_vx * dt
+        y += self._ap_vy * dt
+
+        wrapped = y < -10
+        if wrapped.any():
+            y[wrapped] = SCREEN_HEIGHT + 10
+            x[wrapped] = np.random.randint(0, SCREEN_WIDTH + 1, int(wrapped.sum()))
+        x[x < -10] = SCREEN_WIDTH + 10
+        x[x > SCREEN_WIDTH + 10] = -10
 
     def _update_drawing_phase(self, dt: float):
         """繪製階段更新"""
@@ -283,27 +362,26 @@ class DepositionStage(Scene):
             gx = data.gx  # 左右傾斜
             gy = data.gy  # 前後傾斜
         else:
-            gx, gy = 0.0, 0.0
-
-        def apply_deadzone_and_scale(gyro: float) -> float:
-            if abs(gyro) < self.GYRO_DEADZONE:
-                return 0.0
+            gx, gy = 0, 0
 
-            sign = 1 if gyro > 0 else -1
-            effective = abs(gyro) - self.GYRO_DEADZONE
-            max_effective = self.GYRO_MAX - self.GYRO_DEADZONE
-            effective = min(effective, max_effective)
-            normalized = effective / max_effective
-            speed = self.CURSOR_MIN_SPEED + normalized * (self.CURSOR_MAX_SPEED - self.CURSOR_MIN_SPEED)
-            return sign * speed
+        # 查表：讀值先限制在 ±GYRO_MAX（超出部分速度已飽和）
+        lut = self._gyro_lut
+        gyro_max = self.GYRO_MAX
 
         # gx 控制左右傾斜（取負號：左傾gx>0 → vx<0向左）
-        vx = -apply_deadzone_and_scale(gx)
+        vx = -lut[max(-gyro_max, min(gyro_max, int(gx))) + gyro_max]
         # gy 控制前後傾斜
-        vy = apply_deadzone_and_scale(gy)
+        vy = lut[max(-gyro_max, min(gyro_max, int(gy))) + gyro_max]
 
         return (vx, vy)
 
+    def _gyro_to_speed(self, gyro: float) -> float:
+        """陀螺儀讀值 → 游標速度（死區外線性映射至最小~最大速度，保留正負號）"""
+        effective = min(abs(gyro) - self.GYRO_DEADZONE, self.GYRO_MAX - self.GYRO_DEADZONE)
+        if effective < 0:
+            return 0.0
+        return math.copysign(self.CURSOR_MIN_SPEED + effective * self.GYRO_SPEED_SCALE, gyro)
+
     def _update_cursor(self, dt: float):
         """更新游標位置"""
         vx, vy = self._get_cursor_velocity()
@@ -312,6 +390,7 @@ class DepositionStage(Scene):
         smoothing = 0.3
         self.cursor_velocity_x = self.cursor_velocity_x * (1 - smoothing) + vx * smoothing
         self.cursor_velocity_y = self.cursor_velocity_y * (1 - smoothing) + vy * smoothing
+        self._cursor_speed = math.hypot(self.cursor_velocity_x, self.cursor_velocity_y)
 
         # 更新位置
         self.cursor_x += self.cursor_velocity_x * dt
@@ -322,55 +401,94 @@ class DepositionStage(Scene):
         self.cursor_x = max(padding, min(SCREEN_WIDTH - padding, self.cursor_x))
         self.cursor_y = max(padding, min(SCREEN_HEIGHT - padding, self.cursor_y))
 
+    def _reset_trail(self):
+        """清空軌跡"""
+        self._pts_n = 0
+        self.last_recorded_pos = None
+        self._trail_bounds = None
+        if self._trail_surface is not None:
+            self._trail_surface.fill((0, 0, 0, 0))
+
+    def _append_trail_point(self, pos: tuple):
+        """加入軌跡點，並在軌跡圖層上只畫出新增的線段"""
+        n = self._pts_n
+        if n == len(self._pts_buf):
+            # 緩衝區已滿時倍增容量
+            self._pts_buf = np.concatenate((self._pts_buf, np.empty_like(self._pts_buf)))
+        self._pts_buf[n] = pos
+        self._pts_n = n + 1
+        if n == 0:
+            return
+
+        surf = self._trail_surface
+        prev = self.last_recorded_pos
+        dirty = pygame.draw.line(surf, PRIMARY_COLOR, prev, pos, 6)
+
+        # 軌跡點標記（每 10 點）：新線段可能蓋到前一點的標記，一併重畫
+        if (n - 1) % 10 == 0:
+            dirty.union_ip(pygame.draw.circle(surf, WHITE, prev, 3))
+        if n % 10 == 0:
+            dirty.union_ip(pygame.draw.circle(surf, WHITE, pos, 3))
+
+        self._trail_bounds = dirty if self._trail_bounds is None else self._trail_bounds.union(dirty)
+
     def _record_trail_point(self):
         """記錄軌跡點"""
         current_pos = (int(self.cursor_x), int(self.cursor_y))
 
         if self.last_recorded_pos is None:
-            self.drawn_points.append(current_pos)
+            self._append_trail_point(current_pos)
             self.last_recorded_pos = current_pos
             return
 
         dx = current_pos[0] - self.last_recorded_pos[0]
         dy = current_pos[1] - self.last_recorded_pos[1]
-        distance = math.sqrt(dx * dx + dy * dy)
 
-        if distance >= self.TRAIL_POINT_INTERVAL:
-            self.drawn_points.append(current_pos)
+        # 以距離平方比較，省去 sqrt
+        if dx * dx + dy * dy >= self.TRAIL_POINT_INTERVAL_SQ:
+            self._append_trail_point(current_pos)
             self.last_recorded_pos = current_pos
 
     def _update_spray_particles(self, dt: float):
         """更新噴灑粒子效果"""
-        import random
+        spray = self._spray
+        n = self._spray_n
 
-        # 移除死亡粒子
-        self.spray_particles = [p for p in self.spray_particles if p['life'] > 0]
+        # 移除死亡粒子（存活粒子壓實到陣列前段）
+        if n:
+            alive = spray['life'][:n] > 0
+            if not alive.all():
+                survivors = spray[:n][alive]
+                n = len(survivors)
+                spray[:n] = survivors
 
         # 新增粒子
-        if self.is_drawing and len(self.spray_particles) < 15:
-            speed = math.sqrt(self.cursor_velocity_x**2 + self.cursor_velocity_y**2)
-            if speed > 10:
+        if self.is_drawing and n < self.SPRAY_MAX_ACTIVE:
+            if self._cursor_speed > 10:
+                uniform = random.uniform
                 for _ in range(2):
-                    self.spray_particles.append({
-                        'x': self.cursor_x + random.uniform(-8, 8),
-                        'y': self.cursor_y + random.uniform(-8, 8),
-                        'vx': random.uniform(-30, 30),
-                        'vy': random.uniform(-30, 30),
-                        'life': 1.0,
-                        'size': random.uniform(3, 6)
-                    })
-
-        # 更新粒子
-        for p in self.spray_particles:
-            p['x'] += p['vx'] * dt
-            p['y'] += p['vy'] * dt
-            p['life'] -= dt * 3
+                    spray[n] = (
+                        self.cursor_x + uniform(-8, 8),
+                        self.cursor_y + uniform(-8, 8),
+                        uniform(-30, 30),
+                        uniform(-30, 30),
+                        1.0,
+                        uniform(3, 6),
+                    )
+                    n += 1
+
+        # 更新粒子（向量化）
+        active = spray[:n]
+        active['x'] += active['vx'] * dt
+        active['y'] += active['vy'] * dt
+        active['life'] -= dt * 3
+        self._spray_n = n
 
     # ==================== 分數計算 ====================
 
     def _calculate_similarity_score(self) -> int:
         """使用 OpenCV 計算總相似度分數"""
-        if len(self.drawn_points) < self.MIN_POINTS_FOR_SCORE:
+        if self._pts_n < self.MIN_POINTS_FOR_SCORE:
             self.distance_score = 0
             self.circularity_score = 0
             self.completeness_score = 0
@@ -378,7 +496,7 @@ class DepositionStage(Scene):
 
         # 使用 OpenCV 評分器
         total_score, component_scores = self.cv_scorer.get_combined_score(
-            self.drawn_points
+            self._pts_buf[:self._pts_n]
         )
 
         # 將 OpenCV 分數映射到原有的顯示欄位
@@ -391,85 +509,6 @@ class DepositionStage(Scene):
 
         return total_score
 
-    def _calculate_distance_score(self) -> float:
-        """計算距離分數：點與理想圓周的接近程度"""
-        if len(self.drawn_points) < self.MIN_POINTS_FOR_SCORE:
-            return 0.0
-
-        cx, cy = self.target_center
-        r = self.target_radius
-
-        total_error = 0.0
-        for px, py in self.drawn_points:
-            dist_to_center = math.sqrt((px - cx)**2 + (py - cy)**2)
-            error = abs(dist_to_center - r)
-            total_error += error
-
-        # 防止除以零
-        if not self.drawn_points:
-            return 0.0
-        avg_error = total_error / len(self.drawn_points)
-        max_acceptable_error = r / 2
-        score = max(0, 100 * (1 - avg_error / max_acceptable_error))
-
-        return score
-
-    def _calculate_circularity_score(self) -> float:
-        """計算圓度分數：形狀的圓形程度"""
-        if len(self.drawn_points) < self.MIN_POINTS_FOR_SCORE:
-            return 0.0
-
-        # 計算繪製點的質心
-        avg_x = sum(p[0] for p in self.drawn_points) / len(self.drawn_points)
-        avg_y = sum(p[1] for p in self.drawn_points) / len(self.drawn_points)
-
-        # 計算各點到質心的距離（半徑）
-        radii = []
-        for px, py in self.drawn_points:
-            r = math.sqrt((px - avg_x)**2 + (py - avg_y)**2)
-            radii.append(r)
-
-        if not radii:
-            return 0.0
-
-        mean_radius = sum(radii) / len(radii)
-        if mean_radius == 0:
-            return 0.0
-
-        variance = sum((r - mean_radius)**2 for r in radii) / len(radii)
-        std_dev = math.sqrt(variance)
-
-        # 變異係數（越小越圓）
-        cv = std_dev / mean_radius
-        score = max(0, 100 * (1 - cv / 0.5))
-
-        return score
-
-    def _calculate_completeness_score(self) -> float:
-        """計算完整度分數：圓周覆蓋率"""
-        if len(self.drawn_points) < self.MIN_POINTS_FOR_SCORE:
-            return 0.0
-
-        cx, cy = self.target_center
-
-        # 將圓分成 36 個扇區（每個 10 度）
-        num_sectors = 36
-        sector_covered = [False] * num_sectors
-
-        for px, py in self.drawn_points:
-            dx = px - cx
-            dy = py - cy
-            angle = math.atan2(dy, dx)
-            angle_deg = math.degrees(angle)
-            if angle_deg < 0:
-                angle_deg += 360
-
-            sector_idx = int(angle_deg / (360 / num_sectors)) % num_sectors
-            sector_covered[sector_idx] = True
-
-        coverage = sum(sector_covered) / num_sectors * 100
-        return coverage
-
     # ==================== 繪製 ====================
 
     def draw(self, screen: pygame.Surface):
@@ -491,11 +530,9 @@ class DepositionStage(Scene):
 
     def _draw_ambient_particles(self, screen: pygame.Surface):
         """繪製環境粒子"""
-        for p in self.ambient_particles:
-            surf = pygame.Surface((int(p['size'] * 2), int(p['size'] * 2)), pygame.SRCALPHA)
-            pygame.draw.circle(surf, (200, 220, 255, p['alpha']),
-                             (int(p['size']), int(p['size'])), int(p['size']))
-            screen.blit(surf, (int(p['x'] - p['size']), int(p['y'] - p['size'])))
+        xs = (self._ap_x - self._ap_size).astype(int).tolist()
+        ys = (self._ap_y - self._ap_size).astype(int).tolist()
+        screen.blits(list(zip(self._ap_glyphs, zip(xs, ys))), doreturn=False)
 
     def _draw_background(self, screen: pygame.Surface):
         """繪製漸層背景（使用預繪製的快取）"""
@@ -569,7 +606,7 @@ class DepositionStage(Scene):
         screen.blit(finish_surface, finish_rect)
 
         # 點數顯示（帶背景面板）
-        points_text = f"軌跡點數: {len(self.drawn_points)}"
+        points_text = f"軌跡點數: {self._pts_n}"
         points_surface = self.small_font.render(points_text, True, TEXT_SECONDARY)
         # 背景
         bg_rect = points_surface.get_rect(topleft=(20, 20)).inflate(16, 8)
@@ -597,11 +634,8 @@ class DepositionStage(Scene):
 
         # 右側：使用者繪製
         right_x = 2 * SCREEN_WIDTH // 3
-        if len(self.drawn_points) >= 2:
-            # 計算偏移量使繪製居中
-            offset_x = right_x - self.target_center[0]
-            shifted_points = [(p[0] + offset_x, p[1]) for p in self.drawn_points]
-            pygame.draw.lines(screen, PRIMARY_COLOR, False, shifted_points, 4)
+        if len(self._result_points) >= 2:
+            pygame.draw.lines(screen, PRIMARY_COLOR, False, self._result_points, 4)
 
         label2 = self.text_font.render("你的繪製", True, WHITE)
         label2_rect = label2.get_rect(center=(right_x, compare_y + self.target_radius + 30))
@@ -633,44 +667,60 @@ class DepositionStage(Scene):
         # 繼續按鈕
         self.next_button.draw(screen)
 
-    def _draw_target_circle(self, screen: pygame.Surface):
-        """繪製目標圓（虛線）"""
-        cx, cy = self.target_center
+    def _build_target_circle_surface(self, phase: int) -> pygame.Surface:
+        """預繪製指定旋轉相位的目標虛線圓（含中心十字）"""
         r = self.target_radius
+        c = r + 2
+        surf = pygame.Surface((c * 2, c * 2), pygame.SRCALPHA)
 
-        # 虛線圓
-        num_dashes = 36
-        dash_angle = 2 * math.pi / num_dashes
+        # 虛線圓（偶數段繪製，圖樣每兩段重複一次）
+        # 以和角公式旋轉查表端點：cos(a+d) = cos a cos d - sin a sin d
+        rotation = phase / self.DASH_PHASES * 4 * math.pi / self.NUM_DASHES
+        cos_d = math.cos(rotation)
+        sin_d = math.sin(rotation)
 
-        for i in range(num_dashes):
-            if i % 2 == 0:
-                start_angle = i * dash_angle + self.dash_offset * 0.02
-                end_angle = start_angle + dash_angle * 0.7
+        start_xs = c + r * (self._dash_start_cos * cos_d - self._dash_start_sin * sin_d)
+        start_ys = c + r * (self._dash_start_sin * cos_d + self._dash_start_cos * sin_d)
+        end_xs = c + r * (self._dash_end_cos * cos_d - self._dash_end_sin * sin_d)
+        end_ys = c + r * (self._dash_end_sin * cos_d + self._dash_end_cos * sin_d)
 
-                start_x = cx + r * math.cos(start_angle)
-                start_y = cy + r * math.sin(start_angle)
-                end_x = cx + r * math.cos(end_angle)
-                end_y = cy + r * math.sin(end_angle)
-
-                pygame.draw.line(screen, LIGHT_GRAY, (start_x, start_y), (end_x, end_y), 2)
+        for sx, sy, ex, ey in zip(start_xs.tolist(), start_ys.tolist(),
+                                  end_xs.tolist(), end_ys.tolist()):
+            pygame.draw.line(surf, LIGHT_GRAY, (sx, sy), (ex, ey), 2)
 
         # 中心十字
         cross_size = 15
-        pygame.draw.line(screen, GRAY, (cx - cross_size, cy), (cx + cross_size, cy), 1)
-        pygame.draw.line(screen, GRAY, (cx, cy - cross_size), (cx, cy + cross_size), 1)
+        pygame.draw.line(surf, GRAY, (c - cross_size, c), (c + cross_size, c), 1)
+        pygame.draw.line(surf, GRAY, (c, c - cross_size), (c, c + cross_size), 1)
+        return surf
+
+    def _draw_target_circle(self, screen: pygame.Surface):
+        """繪製目標圓（虛線，依量化旋轉相位取用預繪製圖層）"""
+        cx, cy = self.target_center
+        c = self.target_radius + 2
+
+        period = 4 * math.pi / self.NUM_DASHES
+        phase = int((self.dash_offset * 0.02) % period / period * self.DASH_PHASES) % self.DASH_PHASES
+        screen.blit(self._dash_cache[phase], (cx - c, cy - c))
+
+    def _build_cursor_surface(self, inner_color) -> pygame.Surface:
+        """預繪製噴頭圖示（外圈、白框、內圈）"""
+        c = self.CURSOR_GLYPH_SIZE // 2
+        surf = pygame.Surface((self.CURSOR_GLYPH_SIZE, self.CURSOR_GLYPH_SIZE), pygame.SRCALPHA)
+        pygame.draw.circle(surf, POLYSILICON_GRAY, (c, c), 15)
+        pygame.draw.circle(surf, WHITE, (c, c), 15, 2)
+        pygame.draw.circle(surf, inner_color, (c, c), 8)
+        return surf
 
     def _draw_cursor(self, screen: pygame.Surface):
         """繪製游標（沉積噴頭）"""
         x, y = int(self.cursor_x), int(self.cursor_y)
 
-        # 噴頭外圈
-        pygame.draw.circle(screen, POLYSILICON_GRAY, (x, y), 15)
-        pygame.draw.circle(screen, WHITE, (x, y), 15, 2)
-
-        # 噴頭內圈（根據速度變色）
-        speed = math.sqrt(self.cursor_velocity_x**2 + self.cursor_velocity_y**2)
-        inner_color = SECONDARY_COLOR if speed > 50 else PRIMARY_COLOR
-        pygame.draw.circle(screen, inner_color, (x, y), 8)
+        # 噴頭圖示（內圈根據速度變色）
+        speed = self._cursor_speed
+        glyph = self._cursor_fast if speed > 50 else self._cursor_slow
+        c = self.CURSOR_GLYPH_SIZE // 2
+        screen.blit(glyph, (x - c, y - c))
 
         # 方向指示
         if speed > 20:
@@ -679,25 +729,19 @@ class DepositionStage(Scene):
             pygame.draw.line(screen, ACCENT_COLOR, (x, y), (x + dir_x, y + dir_y), 3)
 
     def _draw_trail(self, screen: pygame.Surface):
-        """繪製沉積軌跡"""
-        if len(self.drawn_points) < 2:
+        """繪製沉積軌跡（只貼上軌跡圖層中已繪製的範圍）"""
+        if self._trail_bounds is None:
             return
-
-        # 軌跡線
-        pygame.draw.lines(screen, PRIMARY_COLOR, False, self.drawn_points, 6)
-
-        # 軌跡點標記
-        for i, point in enumerate(self.drawn_points):
-            if i % 10 == 0:
-                pygame.draw.circle(screen, WHITE, point, 3)
+        screen.blit(self._trail_surface, self._trail_bounds.topleft, self._trail_bounds)
 
     def _draw_spray_particles(self, screen: pygame.Surface):
         """繪製噴灑粒子"""
-        for p in self.spray_particles:
-            alpha = int(200 * p['life'])
-            size = int(p['size'] * p['life'])
+        active = self._spray[:self._spray_n]
+        for px, py, life, base_size in zip(active['x'].tolist(), active['y'].tolist(),
+                                           active['life'].tolist(), active['size'].tolist()):
+            alpha = int(200 * life)
+            size = int(base_size * life)
             if size > 0 and alpha > 0:
-                color = (*SILICON_BLUE, alpha)
-                surf = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
-                pygame.draw.circle(surf, color, (size, size), size)
-                screen.blit(surf, (int(p['x']) - size, int(p['y']) - size))
+                glyph = self._spray_glyphs[min(size, 6)]
+                glyph.set_alpha(alpha)
+                screen.blit(glyph, (int(px) - size, int(py) - size))
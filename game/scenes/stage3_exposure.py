@@ -6,13 +6,58 @@
 
 import pygame
 import math
-import random
 import numpy as np
 from typing import List
 from collections import deque
 from .base import Scene, Button, ProgressBar, ShapeCard
 from ..config import *
 from ..utils.cv_scoring import ShapeType, SHAPE_METADATA, ShapeSimilarityScorer
+from ..utils.jit import njit
+
+
+def _wafer_grid_mask(grid_size: int) -> np.ndarray:
+    """網格中位於晶圓圓形範圍內的格子（半徑為網格半寬減 2）"""
+    center = grid_size // 2
+    grid_radius = grid_size // 2 - 2
+    gy, gx = np.ogrid[:grid_size, :grid_size]
+    return (gx - center) ** 2 + (gy - center) ** 2 <= grid_radius * grid_radius
+
+
+def _dilate3x3(grid: np.ndarray) -> np.ndarray:
+    """布林網格的 3x3 形態膨脹（先水平再垂直的可分離 OR，邊界不環繞）"""
+    wide = grid.copy()
+    wide[:, 1:] |= grid[:, :-1]
+    wide[:, :-1] |= grid[:, 1:]
+    out = wide.copy()
+    out[1:, :] |= wide[:-1, :]
+    out[:-1, :] |= wide[1:, :]
+    return out
+
+
+# 各圖形的選擇卡片縮圖快取（紫色調 pygame.Surface）
+_THUMB_CACHE = {}
+
+# 各圖形的目標圖案網格快取（圖案只取決於網格參數，首次選用時生成，唯讀共用）
+_PATTERN_CACHE = {}
+
+# 動畫用正弦查表（一週期 256 格；以 int(相位 * _SIN_LUT_SCALE) & _SIN_LUT_MASK 取值，
+# 相位需為非負值；餘弦為索引偏移四分之一週期）
+_SIN_LUT_SIZE = 256
+_SIN_LUT_MASK = _SIN_LUT_SIZE - 1
+_SIN_LUT_SCALE = _SIN_LUT_SIZE / (2 * math.pi)
+_SIN_LUT = tuple(np.sin(np.arange(_SIN_LUT_SIZE) / _SIN_LUT_SCALE).tolist())
+_COS_LUT_OFFSET = _SIN_LUT_SIZE // 4
+
+
+@njit(cache=True)
+def _exposure_quality(samples):
+    """由穩定度樣本計算曝光品質原始分數（未取整、未限制範圍）"""
+    # 基礎分數 = 平均穩定度 * 70（調嚴）
+    base_score = samples.mean() * 70
+
+    # 一致性獎勵 = (1 - 標準差) * 30（提高一致性要求）
+    consistency_bonus = max(0.0, 1.0 - samples.std()) * 30
+    return base_score + consistency_bonus
 
 
 class ExposureStage(Scene):
@@ -29,10 +74,46 @@ class ExposureStage(Scene):
     STABILITY_THRESHOLD = 0.75    # 穩定閾值 (低於此值顯示警告，調嚴)
     FILL_SPEED_STABLE = 0.15      # 穩定時進度填充速度
     FILL_SPEED_UNSTABLE = 0.02    # 不穩定時進度填充速度
+    SENSOR_DT = 1 / 60            # 感測器取樣間隔 (秒)
+    BAR_UPDATE_EPSILON = 0.005    # 進度條更新門檻
+    STABILITY_SMOOTHING = 5       # 穩定度移動平均樣本數
+    MAX_STABILITY_SAMPLES = int(EXPOSURE_DURATION / SENSOR_DT) + 8  # 樣本緩衝區容量
+
+    # 曝光期間阻擋的事件類型（此階段不讀取）
+    EXPOSURE_BLOCKED_EVENTS = [
+        pygame.MOUSEMOTION,
+        pygame.TEXTINPUT,
+        pygame.JOYAXISMOTION,
+        pygame.JOYBALLMOTION,
+        pygame.JOYHATMOTION,
+        pygame.ACTIVEEVENT,
+    ]
+
+    # 穩定度換算
+    INV_GYRO_LSB_PER_DPS = 1.0 / 16.4  # 陀螺儀讀值 → 度/秒
+    INV_STABILITY_RANGE = 1.0 / 17     # 3-20 dps 線性映射範圍的倒數
+
+    # 說明文字
+    INSTRUCTIONS = (
+        "保持裝置穩定，讓UV光均勻曝光晶圓",
+        "穩定度越高，曝光進度越快",
+        "晃動會降低曝光品質！",
+    )
+
+    # UV 光束尺寸（像素）
+    BEAM_WIDTH = 200
+    BEAM_HEIGHT = 200
 
     # 晶圓參數（與第四關一致）
     WAFER_RADIUS = 100            # 晶圓半徑 (像素)
     GRID_SIZE = 40                # 圖案網格解析度
+    _WAFER_MASK = _wafer_grid_mask(GRID_SIZE)
+    RESULT_WAFER_SIZE = 220       # 結果晶圓預繪製圖層尺寸 (像素)
+    TILE_QUANT_STEPS = 16         # 曝光中格子顏色的脈動/進度量化階數（限制圖層快取大小）
+
+    # 環境粒子精靈（半徑 × 透明度量化等級）
+    PARTICLE_SIZES = (1, 2)
+    PARTICLE_ALPHAS = (20, 30, 40, 50)
 
     def __init__(self, game):
         super().__init__(game)
@@ -43,23 +124,41 @@ class ExposureStage(Scene):
         # 曝光狀態
         self.exposure_elapsed = 0.0
         self.exposure_progress = 0.0     # 曝光進度 (0-1)
-        self.stability_samples = []      # 穩定度樣本
         self.current_stability = 0.0
+        self._sensor_accum = 0.0         # 感測器取樣時間累積
+        self._last_stab_val = -1.0       # 上次送進穩定度條的值
+        self._last_prog_val = -1.0       # 上次送進進度條的值
+
+        # 穩定度樣本緩衝區（預先配置，容量涵蓋最長曝光時間的固定取樣數）
+        self._samples_arr = np.empty(self.MAX_STABILITY_SAMPLES, dtype=np.float64)
+        self._samples_n = 0
 
         # 晶圓中心位置
         self.wafer_center_x = SCREEN_WIDTH // 2
         self.wafer_center_y = 280
 
-        # H 形目標圖案網格
-        self.target_grid = [[False] * self.GRID_SIZE for _ in range(self.GRID_SIZE)]
+        # H 形目標圖案網格（0/1 uint8，與快取圖案相同格式）
+        self.target_grid = np.zeros((self.GRID_SIZE, self.GRID_SIZE), dtype=np.uint8)
+        self._stroke_grid = None  # 圖案生成時的線段中心線網格
+
+        # 圖案亮格的格子左上角 blit 位置（確認圖形時由 target_grid 算出）
+        self._lit_cell_pos = []
 
         # 動畫
         self.uv_pulse = 0.0              # UV 光脈動動畫
         self.warning_flash = 0.0         # 警告閃爍
         self.particle_angle = 0.0
 
-        # 穩定度平滑處理
-        self._stability_history = []
+        # 環境粒子（SoA 陣列：位置、速度、尺寸，預繪製精靈另存清單）
+        self._ap_x = np.empty(0)
+        self._ap_y = np.empty(0)
+        self._ap_vx = np.empty(0)
+        self._ap_vy = np.empty(0)
+        self._ap_size = np.empty(0)
+        self._ap_sprites = []
+
+        # 穩定度平滑處理（最近 STABILITY_SMOOTHING 個樣本）
+        self._stability_history = deque(maxlen=self.STABILITY_SMOOTHING)
 
         # 分數
         self.exposure_score = 0
@@ -103,40 +202,104 @@ class ExposureStage(Scene):
     def on_enter(self):
         """進入場景"""
         super().on_enter()
-        self.title_font = pygame.font.SysFont("Microsoft JhengHei", 42)
-        self.text_font = pygame.font.SysFont("Microsoft JhengHei", 24)
-        self.small_font = pygame.font.SysFont("Microsoft JhengHei", 18)
-        self.score_font = pygame.font.SysFont("Microsoft JhengHei", 48)
+        # 字體由全域 FontManager 快取（重新進入關卡時不再重新載入）
+        self.title_font = FontManager.get_sized(42)
+        self.text_font = FontManager.get_sized(24)
+        self.small_font = FontManager.get_sized(18)
+        self.score_font = FontManager.get_sized(48)
+
+        # 預渲染固定文字（轉為顯示格式）
+        def render(font, text, color):
+            return font.render(text, True, color).convert_alpha()
+
+        self._static_texts = {
+            "subtitle_select": render(self.text_font, "選擇要繪製的半導體電路圖案", TEXT_SECONDARY),
+            "hint_select": render(self.small_font, "使用 ← → 選擇，Enter 確定", TEXT_MUTED),
+            "title_instr": render(self.title_font, "曝光顯影 - 保持穩定", WHITE),
+            "instructions": [
+                render(self.text_font, text, TEXT_SECONDARY)
+                for text in self.INSTRUCTIONS
+            ],
+            "title_expo": render(self.title_font, "曝光中 - 保持穩定！", WHITE),
+            "stability_good": render(self.text_font, "穩定度：良好", SECONDARY_COLOR),
+            "stability_bad": render(self.text_font, "穩定度：不穩定！", DANGER_COLOR),
+            "warning": render(self.title_font, "請保持穩定！", DANGER_COLOR),
+            "hint_expo": render(self.small_font, "保持裝置穩定！", LIGHT_GRAY),
+            "title_done": render(self.title_font, "曝光完成！", WHITE),
+        }
+
+        # 曝光進度標籤（依整數百分比快取，最多 101 種）
+        self._progress_label_cache = {}
+
+        # 選擇畫面的已選圖形資訊文字（依圖形快取）
+        self._selection_info_cache = {}
+
+        # 晶圓圖案格子圖層（依 RGBA 顏色快取）
+        self._cell_tile_cache = {}
+
+        # 說明文字的 blit 清單（位置固定）
+        self._instr_blits = [
+            (surface, surface.get_rect(center=(SCREEN_WIDTH // 2, 420 + i * 35)))
+            for i, surface in enumerate(self._static_texts["instructions"])
+        ]
+
+        # UV 光暈圖層快取（依基礎半徑）、標準寬度光束與縮放光束快取（依寬度）
+        self._uv_glow_cache = {}
+        self._beam_surf = self._build_beam_surface().convert_alpha()
+        self._beam_scaled_cache = {self.BEAM_WIDTH: self._beam_surf}
+
+        # 晃動時晶圓邊緣的紅色模糊外框
+        r = self.WAFER_RADIUS
+        self._blur_surf = pygame.Surface((r * 2 + 20, r * 2 + 20), pygame.SRCALPHA)
+        pygame.draw.circle(self._blur_surf, (255, 0, 0, 30), (r + 10, r + 10), r + 5, 2)
+        self._blur_surf = self._blur_surf.convert_alpha()
 
         # 預繪製增強版漸層背景（暗紫色調）
-        self._bg_surface = self.create_enhanced_background(UV_PURPLE, add_vignette=True, add_grid=False)
-
-        # 環境粒子（UV光粒子）
-        self.ambient_particles = []
-        for _ in range(20):
-            self.ambient_particles.append({
-                'x': random.randint(0, SCREEN_WIDTH),
-                'y': random.randint(0, SCREEN_HEIGHT),
-                'vx': random.uniform(-5, 5),
-                'vy': random.uniform(-10, -2),
-                'size': random.uniform(1, 2),
-                'alpha': random.randint(20, 50)
-            })
+        self._bg_surface = self.create_enhanced_background(
+            UV_PURPLE, add_vignette=True, add_grid=False
+        ).convert()
+
+        # 環境粒子精靈（依半徑與量化透明度預繪製，粒子共用）
+        self._particle_sprites = {
+            (size, alpha): self._build_particle_sprite(size, alpha)
+            for size in self.PARTICLE_SIZES
+            for alpha in self.PARTICLE_ALPHAS
+        }
+
+        # 環境粒子（UV光粒子，SoA 陣列）
+        count = 20
+        self._ap_x = np.random.randint(0, SCREEN_WIDTH + 1, count).astype(np.float64)
+        self._ap_y = np.random.randint(0, SCREEN_HEIGHT + 1, count).astype(np.float64)
+        self._ap_vx = np.random.uniform(-5, 5, count)
+        self._ap_vy = np.random.uniform(-10, -2, count)
+        self._ap_size = np.random.uniform(1, 2, count)
+        alphas = np.random.randint(20, 51, count)
+        alpha_bins = np.rint((alphas - 20) / 30 * (len(self.PARTICLE_ALPHAS) - 1)).astype(int)
+        self._ap_sprites = [
+            self._particle_sprites[(int(size), self.PARTICLE_ALPHAS[alpha_bin])]
+            for size, alpha_bin in zip(self._ap_size, alpha_bins)
+        ]
 
         # 重置狀態 - 從選擇階段開始
         self.phase = self.PHASE_SELECTION
         self.exposure_elapsed = 0.0
         self.exposure_progress = 0.0
-        self.stability_samples = []
+        self._reset_stability_stats()
         self.current_stability = 0.0
         self.exposure_score = 0
         self.uv_pulse = 0.0
         self.warning_flash = 0.0
-        self._stability_history = []  # 重置穩定度歷史
+        self._stability_history.clear()  # 重置穩定度歷史
 
         # 初始化圖形選擇卡片
         self._init_shape_cards()
 
+    def on_exit(self):
+        """離開場景"""
+        super().on_exit()
+        # 恢復曝光期間阻擋的事件（曝光中途離開時）
+        pygame.event.set_allowed(self.EXPOSURE_BLOCKED_EVENTS)
+
     def handle_event(self, event: pygame.event.Event):
         """處理事件"""
         if self.phase == self.PHASE_SELECTION:
@@ -215,26 +378,23 @@ class ExposureStage(Scene):
         start_x = (SCREEN_WIDTH - total_width) // 2
         card_y = 180
 
-        # 建立臨時評分器來生成縮圖
-        temp_scorer = ShapeSimilarityScorer((140, 100))
+        # 縮圖只在首次需要時生成（臨時評分器也僅在此時建立）
+        missing = [shape_type for shape_type in shapes if shape_type not in _THUMB_CACHE]
+        if missing:
+            temp_scorer = ShapeSimilarityScorer((140, 100))
+            for shape_type in missing:
+                thumb_img = temp_scorer.get_thumbnail(shape_type, (140, 100))
+
+                # 將灰階圖轉為紫色 RGB（配合曝光主題）：R = 1/2、G = 1/4、B = 原值
+                thumb_rgb = np.stack((thumb_img >> 1, thumb_img >> 2, thumb_img), axis=-1)
+
+                # 轉換為 pygame surface（surfarray 以 (寬, 高) 為軸序）
+                _THUMB_CACHE[shape_type] = pygame.surfarray.make_surface(thumb_rgb.swapaxes(0, 1))
 
         self.shape_cards = []
         for i, shape_type in enumerate(shapes):
             x = start_x + i * (card_width + spacing)
-
-            # 生成縮圖
-            thumb_img = temp_scorer.get_thumbnail(shape_type, (140, 100))
-
-            # 將灰階圖轉為紫色 RGB（配合曝光主題）
-            thumb_rgb = np.zeros((100, 140, 3), dtype=np.uint8)
-            thumb_rgb[:, :, 0] = thumb_img // 2      # R
-            thumb_rgb[:, :, 1] = thumb_img // 4      # G
-            thumb_rgb[:, :, 2] = thumb_img           # B (紫色為主)
-
-            # 轉換為 pygame surface
-            thumb_surface = pygame.image.frombuffer(
-                thumb_rgb.tobytes(), (140, 100), "RGB"
-            )
+            thumb_surface = _THUMB_CACHE[shape_type]
 
             metadata = SHAPE_METADATA[shape_type]
             card = ShapeCard(x, card_y, card_width, card_height, shape_type, metadata, thumb_surface)
@@ -249,6 +409,7 @@ class ExposureStage(Scene):
         """確認圖形選擇，進入說明階段"""
         # 生成選擇的圖形
         self._generate_target_pattern()
+        self._build_lit_pixels()
         self.phase = self.PHASE_INSTRUCTIONS
 
     def _select_prev_shape(self):
@@ -282,14 +443,91 @@ class ExposureStage(Scene):
         self.phase = self.PHASE_EXPOSURE
         self.exposure_elapsed = 0.0
         self.exposure_progress = 0.0
-        self.stability_samples = []
+        self._reset_stability_stats()
+        self._sensor_accum = self.SENSOR_DT  # 第一幀立即取樣
+        self._last_stab_val = -1.0
+        self._last_prog_val = -1.0
+
+        # 曝光期間不處理滑鼠移動等事件，阻擋以減少事件佇列負擔
+        pygame.event.set_blocked(self.EXPOSURE_BLOCKED_EVENTS)
+
+    def _reset_stability_stats(self):
+        """清空穩定度樣本"""
+        self._samples_n = 0
 
     def _finish_exposure(self):
         """完成曝光，進入結果階段"""
+        pygame.event.set_allowed(self.EXPOSURE_BLOCKED_EVENTS)
         self.exposure_score = self._calculate_score()
         self.game.scores["exposure"] = self.exposure_score
+        self._result_wafer_surf = self._build_result_wafer_surface().convert_alpha()
+        self._render_result_texts()
         self.phase = self.PHASE_RESULT
 
+    def _render_result_texts(self):
+        """預渲染結果畫面的分數與說明文字（分數於結果階段中不再變動）"""
+        score = self.exposure_score
+        score_color = SECONDARY_COLOR if score >= 70 else ACCENT_COLOR if score >= 40 else DANGER_COLOR
+        self._score_surface = self.score_font.render(
+            f"曝光品質: {score} 分", True, score_color
+        ).convert_alpha()
+
+        if score >= 80:
+            detail = "優秀！曝光均勻，圖案清晰"
+        elif score >= 60:
+            detail = "良好，但有些微晃動痕跡"
+        else:
+            detail = "曝光不均勻，需要改進穩定度"
+        self._detail_surface = self.text_font.render(detail, True, LIGHT_GRAY).convert_alpha()
+
+        # 晶圓品質標籤
+        quality = score / 100
+        if quality > 0.7:
+            label = "優質"
+            label_color = SECONDARY_COLOR
+        elif quality > 0.4:
+            label = "合格"
+            label_color = ACCENT_COLOR
+        else:
+            label = "不良"
+            label_color = DANGER_COLOR
+        self._quality_label_surface = self.small_font.render(label, True, label_color).convert_alpha()
+
+    def _build_result_wafer_surface(self) -> pygame.Surface:
+        """預繪製結果晶圓（底座、本體、曝光圖案與邊框；結果階段中不再變動）"""
+        radius = self.WAFER_RADIUS
+        c = self.RESULT_WAFER_SIZE // 2
+        surf = pygame.Surface((self.RESULT_WAFER_SIZE, self.RESULT_WAFER_SIZE), pygame.SRCALPHA)
+
+        # 晶圓底座與本體
+        pygame.draw.circle(surf, DARK_GRAY, (c, c), radius + 5)
+        pygame.draw.circle(surf, SILICON_BLUE, (c, c), radius)
+
+        quality = self.exposure_score / 100
+        cell_size = (radius * 2) / self.GRID_SIZE
+
+        # 根據品質決定圖案顏色與透明度
+        if quality > 0.7:
+            pattern_color = SECONDARY_COLOR
+        elif quality > 0.4:
+            pattern_color = ACCENT_COLOR
+        else:
+            pattern_color = DANGER_COLOR
+        alpha = int(180 + 70 * quality)
+
+        cell_surf = pygame.Surface((cell_size + 1, cell_size + 1), pygame.SRCALPHA)
+        cell_surf.fill((*pattern_color, alpha))
+
+        # 曝光後的圖案格子（整批 blits）
+        offset_x = c - self.wafer_center_x
+        offset_y = c - self.wafer_center_y
+        cells = [(cell_surf, (x + offset_x, y + offset_y)) for x, y in self._lit_cell_pos]
+        surf.blits(cells, doreturn=False)
+
+        # 邊框
+        pygame.draw.circle(surf, WHITE, (c, c), radius, 3)
+        return surf
+
     def _finish_stage(self):
         """完成關卡，進入下一關"""
         # 檢查 stage4 是否存在，否則進入 result
@@ -299,14 +537,28 @@ class ExposureStage(Scene):
             self.switch_to("result")
 
     def _generate_target_pattern(self):
-        """根據選擇的圖形類型生成目標圖案"""
+        """根據選擇的圖形類型取得目標圖案（未快取時生成）"""
         shape_type = self.game.selected_shape_type
 
-        # 清空網格
-        for y in range(self.GRID_SIZE):
-            for x in range(self.GRID_SIZE):
-                self.target_grid[y][x] = False
-
+        grid = _PATTERN_CACHE.get(shape_type)
+        if grid is None:
+            # 生成器寫入全新的空白布林網格，完成後設為唯讀，
+            # 以同一緩衝區的 0/1 uint8 檢視快取（可直接交給 np.count_nonzero / cv2 遮罩運算）
+            # （_draw_line 只記錄中心線，生成後一次膨脹成 3x3 粗線）
+            self.target_grid = np.zeros((self.GRID_SIZE, self.GRID_SIZE), dtype=np.bool_)
+            self._stroke_grid = np.zeros((self.GRID_SIZE, self.GRID_SIZE), dtype=np.bool_)
+            self._run_pattern_generator(shape_type)
+            grid = self.target_grid
+            grid |= _dilate3x3(self._stroke_grid)
+            grid &= self._WAFER_MASK  # 一次裁切到晶圓範圍內
+            grid.setflags(write=False)
+            grid = grid.view(np.uint8)
+            _PATTERN_CACHE[shape_type] = grid
+
+        self.target_grid = grid
+
+    def _run_pattern_generator(self, shape_type: ShapeType):
+        """執行對應圖形的圖案生成器（寫入 self.target_grid）"""
         if shape_type == ShapeType.PENTAGON_STAR:
             self._generate_pentagon_star_pattern()
         elif shape_type == ShapeType.CIRCLE_STAR:
@@ -324,12 +576,7 @@ class ExposureStage(Scene):
         radius = 10
 
         # 計算五邊形頂點
-        pentagon_points = []
-        for i in range(5):
-            angle = math.radians(-90 + i * 72)
-            x = int(center + radius * math.cos(angle))
-            y = int(center + radius * math.sin(angle))
-            pentagon_points.append((x, y))
+        pentagon_points = self._pentagon_vertices(center, radius)
 
         # 繪製五邊形外框
         for i in range(5):
@@ -348,24 +595,13 @@ class ExposureStage(Scene):
         center = self.GRID_SIZE // 2
         radius = 10
 
-        # 繪製圓形外框
-        for y in range(self.GRID_SIZE):
-            for x in range(self.GRID_SIZE):
-                dx = x - center
-                dy = y - center
-                dist = math.sqrt(dx * dx + dy * dy)
-                if radius - 1.5 <= dist <= radius + 1.5:
-                    if self._is_in_wafer_grid(x, y):
-                        self.target_grid[y][x] = True
+        # 繪製圓形外框（以距離平方比較環帶，向量化）
+        gy, gx = np.ogrid[:self.GRID_SIZE, :self.GRID_SIZE]
+        d2 = (gx - center) ** 2 + (gy - center) ** 2
+        self.target_grid |= (d2 >= (radius - 1.5) ** 2) & (d2 <= (radius + 1.5) ** 2)
 
         # 計算五角星頂點
-        star_radius = radius - 2
-        star_points = []
-        for i in range(5):
-            angle = math.radians(-90 + i * 72)
-            x = int(center + star_radius * math.cos(angle))
-            y = int(center + star_radius * math.sin(angle))
-            star_points.append((x, y))
+        star_points = self._pentagon_vertices(center, radius - 2)
 
         # 繪製五角星
         for i in range(5):
@@ -379,40 +615,25 @@ class ExposureStage(Scene):
         oval_a = 12  # 橫軸半徑
         oval_b = 8   # 縱軸半徑
 
-        # 繪製橢圓形外框
-        for y in range(self.GRID_SIZE):
-            for x in range(self.GRID_SIZE):
-                dx = x - center
-                dy = y - center
-                # 橢圓方程式
-                val = (dx * dx) / (oval_a * oval_a) + (dy * dy) / (oval_b * oval_b)
-                if 0.85 <= val <= 1.15:
-                    if self._is_in_wafer_grid(x, y):
-                        self.target_grid[y][x] = True
-
-        # 繪製內部長方形
+        # 繪製橢圓形外框（橢圓方程式，向量化）
+        gy, gx = np.ogrid[:self.GRID_SIZE, :self.GRID_SIZE]
+        dx = gx - center
+        dy = gy - center
+        val = (dx * dx) / (oval_a * oval_a) + (dy * dy) / (oval_b * oval_b)
+        self.target_grid |= (val >= 0.85) & (val <= 1.15)
+
+        # 繪製內部長方形（各邊為 3 格寬的矩形區塊，以切片填滿）
         rect_w = 8
         rect_h = 5
+        grid = self.target_grid
         # 頂邊
-        for x in range(center - rect_w, center + rect_w + 1):
-            for y in range(center - rect_h - 1, center - rect_h + 2):
-                if self._is_in_wafer_grid(x, y):
-                    self.target_grid[y][x] = True
+        grid[center - rect_h - 1:center - rect_h + 2, center - rect_w:center + rect_w + 1] = True
         # 底邊
-        for x in range(center - rect_w, center + rect_w + 1):
-            for y in range(center + rect_h - 1, center + rect_h + 2):
-                if self._is_in_wafer_grid(x, y):
-                    self.target_grid[y][x] = True
+        grid[center + rect_h - 1:center + rect_h + 2, center - rect_w:center + rect_w + 1] = True
         # 左邊
-        for y in range(center - rect_h, center + rect_h + 1):
-            for x in range(center - rect_w - 1, center - rect_w + 2):
-                if self._is_in_wafer_grid(x, y):
-                    self.target_grid[y][x] = True
+        grid[center - rect_h:center + rect_h + 1, center - rect_w - 1:center - rect_w + 2] = True
         # 右邊
-        for y in range(center - rect_h, center + rect_h + 1):
-            for x in range(center + rect_w - 1, center + rect_w + 2):
-                if self._is_in_wafer_grid(x, y):
-                    self.target_grid[y][x] = True
+        grid[center - rect_h:center + rect_h + 1, center + rect_w - 1:center + rect_w + 2] = True
 
     def _generate_pyramid_pattern(self):
         """生成金字塔晶體圖案（3D 四角錐）"""
@@ -443,20 +664,27 @@ class ExposureStage(Scene):
         self._draw_line(apex[0], apex[1], front_point[0], front_point[1])
         self._draw_line(apex[0], apex[1], back_point[0], back_point[1])
 
+    @staticmethod
+    def _pentagon_vertices(center: int, radius: float) -> list:
+        """正五邊形頂點（由正上方起順時針，座標取整）"""
+        angles = np.radians(-90 + np.arange(5) * 72)
+        xs = (center + radius * np.cos(angles)).astype(int)
+        ys = (center + radius * np.sin(angles)).astype(int)
+        return list(zip(xs.tolist(), ys.tolist()))
+
     def _draw_line(self, x0: int, y0: int, x1: int, y1: int):
-        """在網格上繪製線段（Bresenham 算法）"""
+        """在中心線網格上記錄線段（Bresenham 算法；3x3 粗線於圖案生成後統一膨脹）"""
         dx = abs(x1 - x0)
         dy = abs(y1 - y0)
         sx = 1 if x0 < x1 else -1
         sy = 1 if y0 < y1 else -1
         err = dx - dy
 
+        xs = []
+        ys = []
         while True:
-            # 繪製粗線（3x3）
-            for ddx in range(-1, 2):
-                for ddy in range(-1, 2):
-                    if self._is_in_wafer_grid(x0 + ddx, y0 + ddy):
-                        self.target_grid[y0 + ddy][x0 + ddx] = True
+            xs.append(x0)
+            ys.append(y0)
 
             if x0 == x1 and y0 == y1:
                 break
@@ -468,29 +696,26 @@ class ExposureStage(Scene):
                 err += dx
                 y0 += sy
 
-    def _is_in_wafer_grid(self, gx: int, gy: int) -> bool:
-        """檢查網格座標是否在晶圓範圍內"""
-        if gx < 0 or gx >= self.GRID_SIZE or gy < 0 or gy >= self.GRID_SIZE:
-            return False
+        # 中心線（超出網格的點捨棄，其粗線本就落在晶圓範圍外）
+        gx = np.array(xs)
+        gy = np.array(ys)
+        inside = (gx >= 0) & (gx < self.GRID_SIZE) & (gy >= 0) & (gy < self.GRID_SIZE)
+        self._stroke_grid[gy[inside], gx[inside]] = True
 
-        # 轉換為相對於中心的座標
-        center = self.GRID_SIZE // 2
-        dx = gx - center
-        dy = gy - center
+    def _build_lit_pixels(self):
+        """
+        將 target_grid 中的亮格一次換算為格子左上角的 blit 位置（圖案已裁切到晶圓範圍內）
 
-        # 檢查是否在圓形範圍內
-        grid_radius = self.GRID_SIZE // 2 - 2
-        return (dx * dx + dy * dy) <= (grid_radius * grid_radius)
-
-    def _grid_to_pixel(self, gx: int, gy: int) -> tuple:
-        """將網格座標轉換為像素座標"""
+        像素中心 = 晶圓中心 + (網格座標 - 網格中心) * 格寬，再左上偏移半格
+        """
+        gy, gx = np.nonzero(self.target_grid)
         grid_center = self.GRID_SIZE // 2
         scale = (self.WAFER_RADIUS * 2) / self.GRID_SIZE
+        px = (self.wafer_center_x + (gx - grid_center) * scale).astype(np.int32)
+        py = (self.wafer_center_y + (gy - grid_center) * scale).astype(np.int32)
 
-        px = self.wafer_center_x + (gx - grid_center) * scale
-        py = self.wafer_center_y + (gy - grid_center) * scale
-
-        return (px, py)
+        half = scale / 2
+        self._lit_cell_pos = list(zip((px - half).tolist(), (py - half).tolist()))
 
     def _get_stability(self) -> float:
         """取得穩定度（使用陀螺儀檢測旋轉運動）"""
@@ -498,42 +723,29 @@ class ExposureStage(Scene):
             data = self.game.sensor.get_imu_data()
 
             # 使用陀螺儀檢測旋轉運動（靈敏度: 16.4 LSB/dps）
-            gyro_magnitude = (data.gx ** 2 + data.gy ** 2 + data.gz ** 2) ** 0.5
-            gyro_dps = gyro_magnitude / 16.4  # 轉換為 度/秒
+            gyro_dps = math.hypot(data.gx, data.gy, data.gz) * self.INV_GYRO_LSB_PER_DPS
 
             # 死區：< 3 dps 視為完全穩定（調嚴）
             if gyro_dps < 3:
                 raw_stability = 1.0
             else:
                 # 3-20 dps 線性映射到 1.0-0.0（調嚴）
-                raw_stability = max(0.0, 1.0 - (gyro_dps - 3) / 17)
+                raw_stability = max(0.0, 1.0 - (gyro_dps - 3) * self.INV_STABILITY_RANGE)
 
-            # 使用移動平均平滑化（最近 5 個樣本）
-            self._stability_history.append(raw_stability)
-            if len(self._stability_history) > 5:
-                self._stability_history.pop(0)
-            return sum(self._stability_history) / len(self._stability_history)
+            # 使用移動平均平滑化（deque 自動淘汰最舊樣本）
+            history = self._stability_history
+            history.append(raw_stability)
+            return sum(history) / len(history)
         return 1.0  # 裝置未連接時視為穩定
 
     def _calculate_score(self) -> int:
         """計算曝光品質分數"""
-        if len(self.stability_samples) < 10:
+        n = self._samples_n
+        if n < 10:
             return 50  # 樣本不足給基本分
 
-        # 計算平均穩定度
-        avg_stability = sum(self.stability_samples) / len(self.stability_samples)
-
-        # 計算穩定度一致性（標準差越小越好）
-        variance = sum((s - avg_stability) ** 2 for s in self.stability_samples) / len(self.stability_samples)
-        std_dev = variance ** 0.5
-
-        # 基礎分數 = 平均穩定度 * 70（調嚴）
-        base_score = avg_stability * 70
-
-        # 一致性獎勵 = (1 - 標準差) * 30（提高一致性要求）
-        consistency_bonus = max(0, (1 - std_dev)) * 30
-
-        total = int(base_score + consistency_bonus)
+        # 平均穩定度與一致性（標準差越小越好）整段於 JIT 核心計算
+        total = int(_exposure_quality(self._samples_arr[:n]))
         return max(0, min(100, total))
 
     def update(self, dt: float):
@@ -569,43 +781,67 @@ class ExposureStage(Scene):
             pass
 
     def _update_ambient_particles(self, dt: float):
-        """更新環境粒子"""
-        for p in self.ambient_particles:
-            p['x'] += p['vx'] * dt
-            p['y'] += p['vy'] * dt
-            if p['y'] < -10:
-                p['y'] = SCREEN_HEIGHT + 10
-                p['x'] = random.randint(0, SCREEN_WIDTH)
-            if p['x'] < -10:
-                p['x'] = SCREEN_WIDTH + 10
-            elif p['x'] > SCREEN_WIDTH + 10:
-                p['x'] = -10
+        """更新環境粒子（NumPy 向量化）"""
+        x = self._ap_x
+        y = self._ap_y
+        x += self._ap_vx * dt
+        y += self._ap_vy * dt
+
+        wrapped = y < -10
+        if wrapped.any():
+            y[wrapped] = SCREEN_HEIGHT + 10
+            x[wrapped] = np.random.randint(0, SCREEN_WIDTH + 1, int(wrapped.sum()))
+        x[x < -10] = SCREEN_WIDTH + 10
+        x[x > SCREEN_WIDTH + 10] = -10
 
     def _update_exposure_phase(self, dt: float):
-        """曝光階段更新"""
+        """曝光階段更新（常用屬性先綁定為區域變數）"""
         # 更新經過時間
-        self.exposure_elapsed += dt
-
-        # 取得當前穩定度
-        self.current_stability = self._get_stability()
-        self.stability_samples.append(self.current_stability)
-
-        # 更新穩定度顯示條
-        self.stability_bar.set_progress(self.current_stability)
+        elapsed = self.exposure_elapsed + dt
+        self.exposure_elapsed = elapsed
+
+        # 以固定取樣率記錄穩定度樣本（與畫面更新率脫鉤）：
+        # 每幀最多讀取並平滑一次感測器，再依到期的取樣次數寫入預配置緩衝區（已滿時忽略）
+        stability = self.current_stability
+        accum = self._sensor_accum
+        sensor_dt = self.SENSOR_DT
+        if accum >= sensor_dt:
+            stability = self._get_stability()
+            samples = self._samples_arr
+            n = self._samples_n
+            while accum >= sensor_dt:
+                accum -= sensor_dt
+                if n < self.MAX_STABILITY_SAMPLES:
+                    samples[n] = stability
+                    n += 1
+            self._samples_n = n
+        self._sensor_accum = accum + dt
+        self.current_stability = stability
+
+        # 更新穩定度顯示條（變化小於門檻時略過）
+        if abs(stability - self._last_stab_val) > self.BAR_UPDATE_EPSILON:
+            self.stability_bar.set_progress(stability)
+            self._last_stab_val = stability
 
         # 根據穩定度更新曝光進度
-        if self.current_stability >= self.STABILITY_THRESHOLD:
-            self.exposure_progress += self.FILL_SPEED_STABLE * dt
-            self.warning_flash = max(0, self.warning_flash - dt * 3)
+        progress = self.exposure_progress
+        warn = self.warning_flash
+        if stability >= self.STABILITY_THRESHOLD:
+            progress += self.FILL_SPEED_STABLE * dt
+            warn = max(0.0, warn - dt * 3)
         else:
-            self.exposure_progress += self.FILL_SPEED_UNSTABLE * dt
-            self.warning_flash = min(1, self.warning_flash + dt * 5)
+            progress += self.FILL_SPEED_UNSTABLE * dt
+            warn = min(1.0, warn + dt * 5)
+        self.exposure_progress = progress
+        self.warning_flash = warn
 
-        # 更新進度條
-        self.progress_bar.set_progress(self.exposure_progress)
+        # 更新進度條（變化小於門檻時略過）
+        if abs(progress - self._last_prog_val) > self.BAR_UPDATE_EPSILON:
+            self.progress_bar.set_progress(progress)
+            self._last_prog_val = progress
 
         # 檢查是否完成
-        if self.exposure_progress >= 1.0 or self.exposure_elapsed >= self.EXPOSURE_DURATION:
+        if progress >= 1.0 or elapsed >= self.EXPOSURE_DURATION:
             self._finish_exposure()
 
     def draw(self, screen: pygame.Surface):
@@ -633,45 +869,48 @@ class ExposureStage(Scene):
         self.draw_title(screen, "選擇電路圖案", y=60, font=self.title_font)
 
         # 副標題
-        subtitle = self.text_font.render(
-            "選擇要繪製的半導體電路圖案", True, TEXT_SECONDARY
-        )
+        subtitle = self._static_texts["subtitle_select"]
         subtitle_rect = subtitle.get_rect(center=(SCREEN_WIDTH // 2, 120))
         screen.blit(subtitle, subtitle_rect)
 
-        # 繪製圖形選擇卡片
+        # 繪製圖形選擇卡片（先畫各卡片外框，縮圖與文字合併為單次 blits）
+        blit_seq = []
         for card in self.shape_cards:
-            card.draw(screen, self.text_font, self.small_font)
+            card.draw_frame(screen)
+            blit_seq.extend(card.get_blits(self.text_font, self.small_font))
 
-        # 已選擇的圖形資訊
-        selected_meta = SHAPE_METADATA[self.game.selected_shape_type]
-        status = f"已選擇: {selected_meta['display_name']}"
-        status_surface = self.text_font.render(status, True, SECONDARY_COLOR)
-        status_rect = status_surface.get_rect(center=(SCREEN_WIDTH // 2, 450))
-        screen.blit(status_surface, status_rect)
-
-        # 圖形描述
-        desc = selected_meta["description"]
-        desc_surface = self.small_font.render(desc, True, TEXT_MUTED)
-        desc_rect = desc_surface.get_rect(center=(SCREEN_WIDTH // 2, 490))
-        screen.blit(desc_surface, desc_rect)
+        # 已選擇的圖形資訊與描述（依圖形快取）
+        blit_seq.extend(self._get_selection_info(self.game.selected_shape_type))
+        screen.blits(blit_seq, doreturn=False)
 
         # 鍵盤提示
-        hint = "使用 ← → 選擇，Enter 確定"
-        hint_surface = self.small_font.render(hint, True, TEXT_MUTED)
+        hint_surface = self._static_texts["hint_select"]
         hint_rect = hint_surface.get_rect(center=(SCREEN_WIDTH // 2, 530))
         screen.blit(hint_surface, hint_rect)
 
         # 確認按鈕
         self.confirm_button.draw(screen)
 
+    def _get_selection_info(self, shape_type) -> list:
+        """取得已選擇圖形的狀態與描述文字 (surface, rect) 清單（同一圖形只渲染一次）"""
+        info = self._selection_info_cache.get(shape_type)
+        if info is None:
+            selected_meta = SHAPE_METADATA[shape_type]
+            status = f"已選擇: {selected_meta['display_name']}"
+            status_surface = self.text_font.render(status, True, SECONDARY_COLOR)
+            desc_surface = self.small_font.render(selected_meta["description"], True, TEXT_MUTED)
+            info = [
+                (status_surface, status_surface.get_rect(center=(SCREEN_WIDTH // 2, 450))),
+                (desc_surface, desc_surface.get_rect(center=(SCREEN_WIDTH // 2, 490))),
+            ]
+            self._selection_info_cache[shape_type] = info
+        return info
+
     def _draw_ambient_particles(self, screen: pygame.Surface):
-        """繪製環境粒子"""
-        for p in self.ambient_particles:
-            surf = pygame.Surface((int(p['size'] * 2), int(p['size'] * 2)), pygame.SRCALPHA)
-            pygame.draw.circle(surf, (*UV_PURPLE_GLOW, p['alpha']),
-                             (int(p['size']), int(p['size'])), int(p['size']))
-            screen.blit(surf, (int(p['x'] - p['size']), int(p['y'] - p['size'])))
+        """繪製環境粒子（預繪製精靈，單次批次 blit）"""
+        xs = (self._ap_x - self._ap_size).astype(int).tolist()
+        ys = (self._ap_y - self._ap_size).astype(int).tolist()
+        screen.blits(list(zip(self._ap_sprites, zip(xs, ys))), doreturn=False)
 
     def _draw_background(self, screen: pygame.Surface):
         """繪製漸層背景（使用預繪製的快取）"""
@@ -680,23 +919,14 @@ class ExposureStage(Scene):
     def _draw_instructions(self, screen: pygame.Surface):
         """繪製指示畫面"""
         # 標題（帶光暈）
-        self.draw_title(screen, "曝光顯影 - 保持穩定", y=80, font=self.title_font)
+        title = self._static_texts["title_instr"]
+        screen.blit(title, title.get_rect(center=(SCREEN_WIDTH // 2, 80)))
 
         # 晶圓預覽
         self._draw_wafer_preview(screen, SCREEN_WIDTH // 2, 280)
 
         # 說明文字
-        instructions = [
-            "保持裝置穩定，讓UV光均勻曝光晶圓",
-            "穩定度越高，曝光進度越快",
-            "晃動會降低曝光品質！"
-        ]
-
-        y_start = 420
-        for i, text in enumerate(instructions):
-            surface = self.text_font.render(text, True, TEXT_SECONDARY)
-            rect = surface.get_rect(center=(SCREEN_WIDTH // 2, y_start + i * 35))
-            screen.blit(surface, rect)
+        screen.blits(self._instr_blits, doreturn=False)
 
         # 開始按鈕
         self.start_button.draw(screen)
@@ -704,7 +934,7 @@ class ExposureStage(Scene):
     def _draw_exposure_phase(self, screen: pygame.Surface):
         """繪製曝光階段"""
         # 標題
-        title = self.title_font.render("曝光中 - 保持穩定！", True, WHITE)
+        title = self._static_texts["title_expo"]
         title_rect = title.get_rect(center=(SCREEN_WIDTH // 2, 40))
         screen.blit(title, title_rect)
 
@@ -715,15 +945,10 @@ class ExposureStage(Scene):
         self._draw_wafer_exposing(screen, SCREEN_WIDTH // 2, 280)
 
         # 穩定度顯示
-        stability_label = "穩定度："
         if self.current_stability >= self.STABILITY_THRESHOLD:
-            stability_label += "良好"
-            label_color = SECONDARY_COLOR
+            stability_text = self._static_texts["stability_good"]
         else:
-            stability_label += "不穩定！"
-            label_color = DANGER_COLOR
-
-        stability_text = self.text_font.render(stability_label, True, label_color)
+            stability_text = self._static_texts["stability_bad"]
         stability_rect = stability_text.get_rect(center=(SCREEN_WIDTH // 2, 490))
         screen.blit(stability_text, stability_rect)
 
@@ -731,55 +956,54 @@ class ExposureStage(Scene):
 
         # 警告效果
         if self.warning_flash > 0:
-            warning_alpha = int(150 * self.warning_flash * (0.5 + 0.5 * math.sin(self.uv_pulse * 3)))
-            warning_surf = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-            warning_surf.fill((255, 0, 0, warning_alpha))
-            screen.blit(warning_surf, (0, 0))
-
-            warning_text = self.title_font.render("請保持穩定！", True, DANGER_COLOR)
+            wave = _SIN_LUT[int(self.uv_pulse * 3 * _SIN_LUT_SCALE) & _SIN_LUT_MASK]
+            warning_alpha = int(150 * self.warning_flash * (0.5 + 0.5 * wave))
+            # 直接在畫面上做紅色 alpha 混合：先整體乘上 (255 - a)，再於紅色通道加上 a
+            dim = 255 - warning_alpha
+            screen.fill((dim, dim, dim), special_flags=pygame.BLEND_RGB_MULT)
+            screen.fill((warning_alpha, 0, 0), special_flags=pygame.BLEND_RGB_ADD)
+
+            warning_text = self._static_texts["warning"]
             warning_rect = warning_text.get_rect(center=(SCREEN_WIDTH // 2, 450))
             screen.blit(warning_text, warning_rect)
 
         # 曝光進度
-        progress_label = f"曝光進度: {int(self.exposure_progress * 100)}%"
-        progress_text = self.text_font.render(progress_label, True, WHITE)
+        progress_text = self._get_progress_label(int(self.exposure_progress * 100))
         progress_rect = progress_text.get_rect(center=(SCREEN_WIDTH // 2, 555))
         screen.blit(progress_text, progress_rect)
 
         self.progress_bar.draw(screen)
 
         # 提示
-        hint = "保持裝置穩定！"
-        hint_surface = self.small_font.render(hint, True, LIGHT_GRAY)
+        hint_surface = self._static_texts["hint_expo"]
         hint_rect = hint_surface.get_rect(center=(SCREEN_WIDTH // 2, 650))
         screen.blit(hint_surface, hint_rect)
 
+    def _get_progress_label(self, percent: int) -> pygame.Surface:
+        """取得曝光進度標籤（同一百分比只渲染一次）"""
+        surface = self._progress_label_cache.get(percent)
+        if surface is None:
+            surface = self.text_font.render(f"曝光進度: {percent}%", True, WHITE).convert_alpha()
+            self._progress_label_cache[percent] = surface
+        return surface
+
     def _draw_result(self, screen: pygame.Surface):
         """繪製結果畫面"""
         # 標題
-        title = self.title_font.render("曝光完成！", True, WHITE)
+        title = self._static_texts["title_done"]
         title_rect = title.get_rect(center=(SCREEN_WIDTH // 2, 50))
         screen.blit(title, title_rect)
 
         # 完成的晶圓
         self._draw_wafer_complete(screen, SCREEN_WIDTH // 2, 280)
 
-        # 分數顯示
-        score_color = SECONDARY_COLOR if self.exposure_score >= 70 else ACCENT_COLOR if self.exposure_score >= 40 else DANGER_COLOR
-        score_text = f"曝光品質: {self.exposure_score} 分"
-        score_surface = self.score_font.render(score_text, True, score_color)
+        # 分數顯示（進入結果階段時預渲染）
+        score_surface = self._score_surface
         score_rect = score_surface.get_rect(center=(SCREEN_WIDTH // 2, 480))
         screen.blit(score_surface, score_rect)
 
         # 詳細說明
-        if self.exposure_score >= 80:
-            detail = "優秀！曝光均勻，圖案清晰"
-        elif self.exposure_score >= 60:
-            detail = "良好，但有些微晃動痕跡"
-        else:
-            detail = "曝光不均勻，需要改進穩定度"
-
-        detail_surface = self.text_font.render(detail, True, LIGHT_GRAY)
+        detail_surface = self._detail_surface
         detail_rect = detail_surface.get_rect(center=(SCREEN_WIDTH // 2, 530))
         screen.blit(detail_surface, detail_rect)
 
@@ -792,34 +1016,72 @@ class ExposureStage(Scene):
         center_y = 100
 
         # UV 光源
-        pulse = 0.7 + 0.3 * math.sin(self.uv_pulse)
+        pulse = 0.7 + 0.3 * _SIN_LUT[int(self.uv_pulse * _SIN_LUT_SCALE) & _SIN_LUT_MASK]
         base_radius = int(60 * pulse)
 
-        # 光暈層
-        for i in range(5, 0, -1):
-            alpha = int(30 * pulse * (6 - i) / 5)
-            radius = base_radius + i * 20
-            surf = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
-            color = (*PHOTORESIST_PURPLE, alpha)
-            pygame.draw.circle(surf, color, (radius, radius), radius)
-            screen.blit(surf, (center_x - radius, center_y - radius))
+        # 光暈層（同一基礎半徑的五層光暈合成為單一圖層）
+        glow = self._uv_glow_cache.get(base_radius)
+        if glow is None:
+            glow = self._build_uv_glow_surface(base_radius).convert_alpha()
+            self._uv_glow_cache[base_radius] = glow
+        outer = glow.get_width() // 2
+        screen.blit(glow, (center_x - outer, center_y - outer))
 
-        # 光束
+        # 光束（標準寬度圖層，依寬度縮放、以整體透明度調整亮度）
         if self.current_stability >= self.STABILITY_THRESHOLD:
-            beam_width = 200
+            beam_width = self.BEAM_WIDTH
             beam_alpha = int(80 * pulse)
+            beam_surf = self._beam_surf
         else:
-            beam_width = 200 + int(50 * math.sin(self.uv_pulse * 5))
+            wave = _SIN_LUT[int(self.uv_pulse * 5 * _SIN_LUT_SCALE) & _SIN_LUT_MASK]
+            beam_width = self.BEAM_WIDTH + int(50 * wave)
             beam_alpha = int(40 * pulse)
+            beam_surf = self._beam_scaled_cache.get(beam_width)
+            if beam_surf is None:
+                beam_surf = pygame.transform.scale(self._beam_surf, (beam_width, self.BEAM_HEIGHT))
+                self._beam_scaled_cache[beam_width] = beam_surf
 
-        beam_surf = pygame.Surface((beam_width, 200), pygame.SRCALPHA)
-        pygame.draw.polygon(beam_surf, (*PHOTORESIST_PURPLE, beam_alpha), [
-            (beam_width // 2, 0),
-            (0, 200),
-            (beam_width, 200)
-        ])
+        beam_surf.set_alpha(beam_alpha)
         screen.blit(beam_surf, (center_x - beam_width // 2, center_y + 30))
 
+    def _build_uv_glow_surface(self, base_radius: int) -> pygame.Surface:
+        """合成指定基礎半徑的五層 UV 光暈"""
+        pulse = base_radius / 60
+        outer = base_radius + 5 * 20
+        glow = pygame.Surface((outer * 2, outer * 2), pygame.SRCALPHA)
+        glow.fill((*PHOTORESIST_PURPLE, 0))
+        for i in range(5, 0, -1):
+            alpha = int(30 * pulse * (6 - i) / 5)
+            radius = base_radius + i * 20
+            layer = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+            pygame.draw.circle(layer, (*PHOTORESIST_PURPLE, alpha), (radius, radius), radius)
+            glow.blit(layer, (outer - radius, outer - radius))
+        return glow
+
+    @staticmethod
+    def _build_particle_sprite(size: int, alpha: int) -> pygame.Surface:
+        """預繪製單一環境粒子精靈"""
+        surf = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+        pygame.draw.circle(surf, (*UV_PURPLE_GLOW, alpha), (size, size), size)
+        return surf
+
+    def _build_beam_surface(self) -> pygame.Surface:
+        """預繪製標準寬度的 UV 光束三角形"""
+        w, h = self.BEAM_WIDTH, self.BEAM_HEIGHT
+        surf = pygame.Surface((w, h), pygame.SRCALPHA)
+        pygame.draw.polygon(surf, PHOTORESIST_PURPLE, [(w // 2, 0), (0, h), (w, h)])
+        return surf
+
+    def _get_cell_tile(self, color: tuple) -> pygame.Surface:
+        """取得指定 RGBA 顏色的圖案格子圖層（同色只建立一次）"""
+        tile = self._cell_tile_cache.get(color)
+        if tile is None:
+            size = self.WAFER_RADIUS * 2 / self.GRID_SIZE + 1
+            tile = pygame.Surface((size, size), pygame.SRCALPHA)
+            tile.fill(color)
+            self._cell_tile_cache[color] = tile
+        return tile
+
     def _draw_wafer_preview(self, screen: pygame.Surface, cx: int, cy: int):
         """繪製晶圓預覽（含 H 形目標圖案）"""
         radius = self.WAFER_RADIUS
@@ -831,16 +1093,8 @@ class ExposureStage(Scene):
         pygame.draw.circle(screen, SILICON_BLUE, (cx, cy), radius)
 
         # 繪製 H 形目標圖案（光阻層）
-        cell_size = (radius * 2) / self.GRID_SIZE
-        for gy in range(self.GRID_SIZE):
-            for gx in range(self.GRID_SIZE):
-                if not self._is_in_wafer_grid(gx, gy):
-                    continue
-                if self.target_grid[gy][gx]:
-                    px, py = self._grid_to_pixel(gx, gy)
-                    surf = pygame.Surface((cell_size + 1, cell_size + 1), pygame.SRCALPHA)
-                    surf.fill((*PHOTORESIST_PURPLE, 180))
-                    screen.blit(surf, (px - cell_size / 2, py - cell_size / 2))
+        tile = self._get_cell_tile((*PHOTORESIST_PURPLE, 180))
+        screen.blits([(tile, pos) for pos in self._lit_cell_pos], doreturn=False)
 
         # 邊框
         pygame.draw.circle(screen, WHITE, (cx, cy), radius, 2)
@@ -856,42 +1110,36 @@ class ExposureStage(Scene):
         pygame.draw.circle(screen, SILICON_BLUE, (cx, cy), radius)
 
         # 繪製 H 形圖案曝光效果
-        cell_size = (radius * 2) / self.GRID_SIZE
-        pulse = 0.8 + 0.2 * math.sin(self.uv_pulse)
-
-        for gy in range(self.GRID_SIZE):
-            for gx in range(self.GRID_SIZE):
-                if not self._is_in_wafer_grid(gx, gy):
-                    continue
-                if self.target_grid[gy][gx]:
-                    px, py = self._grid_to_pixel(gx, gy)
-
-                    # 根據曝光進度決定顏色
-                    if self.exposure_progress > 0:
-                        # 已曝光部分：亮紫色脈動
-                        exposed_alpha = int(180 + 50 * pulse * self.exposure_progress)
-                        exposed_color = (
-                            int(PHOTORESIST_PURPLE[0] * pulse),
-                            int(PHOTORESIST_PURPLE[1] * pulse),
-                            int(min(255, PHOTORESIST_PURPLE[2] * (1 + 0.3 * self.exposure_progress))),
-                            min(255, exposed_alpha)
-                        )
-                    else:
-                        # 未曝光：暗紫色
-                        exposed_color = (*PHOTORESIST_PURPLE, 150)
-
-                    surf = pygame.Surface((cell_size + 1, cell_size + 1), pygame.SRCALPHA)
-                    surf.fill(exposed_color)
-                    screen.blit(surf, (px - cell_size / 2, py - cell_size / 2))
+        pulse = 0.8 + 0.2 * _SIN_LUT[int(self.uv_pulse * _SIN_LUT_SCALE) & _SIN_LUT_MASK]
+
+        # 根據曝光進度決定顏色（所有格子同色，每幀只取一個圖層）
+        if self.exposure_progress > 0:
+            # 已曝光部分：亮紫色脈動（脈動與進度量化，快取圖層數有上限）
+            steps = self.TILE_QUANT_STEPS
+            pulse = round(pulse * steps) / steps
+            progress = round(self.exposure_progress * steps) / steps
+            exposed_alpha = int(180 + 50 * pulse * progress)
+            exposed_color = (
+                int(PHOTORESIST_PURPLE[0] * pulse),
+                int(PHOTORESIST_PURPLE[1] * pulse),
+                int(min(255, PHOTORESIST_PURPLE[2] * (1 + 0.3 * progress))),
+                min(255, exposed_alpha)
+            )
+        else:
+            # 未曝光：暗紫色
+            exposed_color = (*PHOTORESIST_PURPLE, 150)
+
+        tile = self._get_cell_tile(exposed_color)
+        screen.blits([(tile, pos) for pos in self._lit_cell_pos], doreturn=False)
 
         # 穩定度視覺化 - 晃動時晶圓邊緣模糊
         if self.current_stability < self.STABILITY_THRESHOLD:
             shake = int(5 * (1 - self.current_stability))
+            blur_surf = self._blur_surf
             for i in range(3):
-                offset_x = int(shake * math.sin(self.uv_pulse + i))
-                offset_y = int(shake * math.cos(self.uv_pulse + i))
-                blur_surf = pygame.Surface((radius * 2 + 20, radius * 2 + 20), pygame.SRCALPHA)
-                pygame.draw.circle(blur_surf, (255, 0, 0, 30), (radius + 10, radius + 10), radius + 5, 2)
+                idx = int((self.uv_pulse + i) * _SIN_LUT_SCALE)
+                offset_x = int(shake * _SIN_LUT[idx & _SIN_LUT_MASK])
+                offset_y = int(shake * _SIN_LUT[(idx + _COS_LUT_OFFSET) & _SIN_LUT_MASK])
                 screen.blit(blur_surf, (cx - radius - 10 + offset_x, cy - radius - 10 + offset_y))
 
         # 邊框
@@ -901,50 +1149,11 @@ class ExposureStage(Scene):
         """繪製完成的晶圓（含 H 形曝光結果）"""
         radius = self.WAFER_RADIUS
 
-        # 晶圓底座
-        pygame.draw.circle(screen, DARK_GRAY, (cx, cy), radius + 5)
-
-        # 晶圓本體
-        pygame.draw.circle(screen, SILICON_BLUE, (cx, cy), radius)
-
-        # 曝光後的 H 形圖案（根據分數決定品質）
-        quality = self.exposure_score / 100
-        cell_size = (radius * 2) / self.GRID_SIZE
-
-        # 根據品質決定圖案顏色
-        if quality > 0.7:
-            pattern_color = SECONDARY_COLOR
-        elif quality > 0.4:
-            pattern_color = ACCENT_COLOR
-        else:
-            pattern_color = DANGER_COLOR
-
-        for gy in range(self.GRID_SIZE):
-            for gx in range(self.GRID_SIZE):
-                if not self._is_in_wafer_grid(gx, gy):
-                    continue
-                if self.target_grid[gy][gx]:
-                    px, py = self._grid_to_pixel(gx, gy)
-                    # 根據品質決定透明度
-                    alpha = int(180 + 70 * quality)
-                    surf = pygame.Surface((cell_size + 1, cell_size + 1), pygame.SRCALPHA)
-                    surf.fill((*pattern_color, alpha))
-                    screen.blit(surf, (px - cell_size / 2, py - cell_size / 2))
-
-        # 邊框
-        pygame.draw.circle(screen, WHITE, (cx, cy), radius, 3)
-
-        # 品質標籤
-        if quality > 0.7:
-            label = "優質"
-            label_color = SECONDARY_COLOR
-        elif quality > 0.4:
-            label = "合格"
-            label_color = ACCENT_COLOR
-        else:
-            label = "不良"
-            label_color = DANGER_COLOR
+        # 晶圓與曝光圖案（進入結果階段時預繪製）
+        c = self.RESULT_WAFER_SIZE // 2
+        screen.blit(self._result_wafer_surf, (cx - c, cy - c))
 
-        label_surface = self.small_font.render(label, True, label_color)
+        # 品質標籤（進入結果階段時預渲染）
+        label_surface = self._quality_label_surface
         label_rect = label_surface.get_rect(center=(cx, cy + radius + 25))
         screen.blit(label_surface, label_rect)
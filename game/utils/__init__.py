@@ -2,7 +2,10 @@
 遊戲工具模組
 """
 
-from .drawing import create_gradient_surface
+from .drawing import create_gradient_surface, create_linear_gradient_surface, create_vignette_surface
 from .cv_scoring import CircleSimilarityScorer
 
-__all__ = ['create_gradient_surface', 'CircleSimilarityScorer']
+__all__ = [
+    'create_gradient_surface', 'create_linear_gradient_surface', 'create_vignette_surface',
+    'CircleSimilarityScorer',
+]
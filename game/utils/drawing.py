@@ -3,10 +3,41 @@
 提供預繪製漸層背景等效能優化功能
 """
 
+import numpy as np
 import pygame
 from ..config import SCREEN_WIDTH, SCREEN_HEIGHT
 
 
+def create_linear_gradient_surface(
+    top_color: tuple,
+    bottom_color: tuple,
+    width: int = SCREEN_WIDTH,
+    height: int = SCREEN_HEIGHT
+) -> pygame.Surface:
+    """
+    建立垂直線性漸層 Surface（取代逐行 draw.line）
+
+    以 NumPy 計算 1 像素寬的漸層色帶，再交由 transform.scale 橫向展開
+
+    Args:
+        top_color: 頂部顏色 (RGB，可為浮點數)
+        bottom_color: 底部顏色 (RGB，可為浮點數)
+        width: 寬度
+        height: 高度
+
+    Returns:
+        預繪製的 pygame.Surface
+    """
+    ratio = np.arange(height, dtype=np.float64)[:, None] / height
+    top = np.asarray(top_color, dtype=np.float64)
+    bottom = np.asarray(bottom_color, dtype=np.float64)
+    column = np.clip(top + (bottom - top) * ratio, 0, 255).astype(np.uint8)
+
+    strip = pygame.Surface((1, height))
+    pygame.surfarray.blit_array(strip, column[None])
+    return pygame.transform.scale(strip, (width, height))
+
+
 def create_gradient_surface(
     base_color: tuple,
     width: int = SCREEN_WIDTH,
@@ -27,17 +58,39 @@ def create_gradient_surface(
     Returns:
         預繪製的 pygame.Surface
     """
-    surface = pygame.Surface((width, height))
-
-    for y in range(height):
-        ratio = y / height
-        r = int(start_color[0] + (base_color[0] - start_color[0]) * ratio * factor)
-        g = int(start_color[1] + (base_color[1] - start_color[1]) * ratio * factor)
-        b = int(start_color[2] + (base_color[2] - start_color[2]) * ratio * factor)
-        # 確保顏色值在有效範圍內
-        r = max(0, min(255, r))
-        g = max(0, min(255, g))
-        b = max(0, min(255, b))
-        pygame.draw.line(surface, (r, g, b), (0, y), (width, y))
+    end_color = tuple(s + (b - s) * factor for s, b in zip(start_color, base_color))
+    return create_linear_gradient_surface(start_color, end_color, width, height)
+
+
+def create_vignette_surface(
+    strength: int = 80,
+    block: int = 4,
+    width: int = SCREEN_WIDTH,
+    height: int = SCREEN_HEIGHT
+) -> pygame.Surface:
+    """
+    以 NumPy 向量化建立暗角遮罩 Surface（取代逐塊 draw.rect）
+
+    Args:
+        strength: 邊角最大不透明度
+        block: 取樣區塊大小（像素）
+        width: 寬度
+        height: 高度
+
+    Returns:
+        黑色、依距中心距離遞增 alpha 的 SRCALPHA Surface
+    """
+    center_x, center_y = width // 2, height // 2
+    max_dist = np.sqrt(center_x ** 2 + center_y ** 2)
+
+    # 每個區塊以左上角座標取樣，再放大回像素尺寸
+    xs = np.arange(0, width, block, dtype=np.float64)[:, None] - center_x
+    ys = np.arange(0, height, block, dtype=np.float64)[None, :] - center_y
+    dist = np.sqrt(xs ** 2 + ys ** 2)
+    alpha = (strength * (dist / max_dist) ** 1.5).astype(np.uint8)
+    alpha = np.repeat(np.repeat(alpha, block, axis=0), block, axis=1)[:width, :height]
 
+    surface = pygame.Surface((width, height), pygame.SRCALPHA)
+    surface.fill((0, 0, 0, 0))
+    pygame.surfarray.pixels_alpha(surface)[:] = alpha
     return surface
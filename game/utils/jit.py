@@ -0,0 +1,28 @@
+"""
+JIT 編譯輔助模組
+有安裝 numba 時以 njit 編譯數值核心函式；未安裝時原樣執行（核心函式以 NumPy 向量化撰寫）
+"""
+
+try:
+    from numba import njit as _numba_njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    _numba_njit = None
+    NUMBA_AVAILABLE = False
+
+
+def njit(*args, **kwargs):
+    """
+    numba.njit 的替代裝飾器
+
+    支援 @njit 與 @njit(cache=True, fastmath=True) 兩種寫法；
+    numba 不可用時直接回傳原函式
+    """
+    if len(args) == 1 and callable(args[0]) and not kwargs:
+        func = args[0]
+        return _numba_njit(func) if NUMBA_AVAILABLE else func
+
+    def decorator(func):
+        return _numba_njit(*args, **kwargs)(func) if NUMBA_AVAILABLE else func
+
+    return decorator